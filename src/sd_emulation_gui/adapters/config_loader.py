@@ -7,10 +7,16 @@ validation, and error handling capabilities.
 
 import json
 import logging
+import os
+import shutil
+import time
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from threading import Lock
-from typing import Any, TypeVar
+from typing import Any, Callable, TypeVar
 
 from pydantic import BaseModel, ValidationError
 
@@ -28,23 +34,52 @@ from meta.config.path_config import PathConfigManager
 from meta.config.path_resolver import PathResolver
 from cache.cache_manager import cache_manager
 from utils.path_utils import PathUtils
+from utils.json_utils import dumps_json, load_json_file, loads_json
 
 T = TypeVar("T", bound=BaseModel)
 
+# Upper bound on threads used by load_all_configs to read files concurrently
+_MAX_LOAD_WORKERS = 8
+
 
 class ConfigCache:
-    """Thread-safe configuration cache with expiration."""
+    """Thread-safe, size-bounded LRU configuration cache with expiration.
+
+    Each key maps to a ``(data, expires_at)`` tuple, so a lookup is a single
+    dict probe; ``expires_at`` is an integer ``time.monotonic_ns()`` deadline,
+    so checking an entry is one int comparison and immune to wall-clock jumps.
+    A sorted list of the same deadlines lets ``get_stats`` count expired
+    entries with a binary search instead of scanning every entry.
+    """
 
-    def __init__(self, default_ttl_seconds: int = 300):
+    def __init__(
+        self,
+        default_ttl_seconds: int = 300,
+        time_func: Callable[[], int] = time.monotonic_ns,
+        max_entries: int = 1024,
+    ) -> None:
         """
         Initialize configuration cache.
 
         Args:
             default_ttl_seconds: Default time-to-live for cached items
+            time_func: Clock returning integer nanoseconds (injectable for tests)
+            max_entries: Entries kept before the least recently used is evicted
         """
-        self._cache: dict[str, dict[str, Any]] = {}
+        self._now = time_func
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._deadlines: list[int] = []
+        # path -> (file signature, parsed config); valid while the signature
+        # (mtime_ns, size, ...) still matches, independent of the TTL, and
+        # bounded by the same max_entries LRU policy
+        self._stat_cache: OrderedDict[str, tuple[tuple[Any, ...], Any]] = OrderedDict()
         self._lock = Lock()
         self.default_ttl = default_ttl_seconds
+        self.max_entries = max_entries
+
+    def _remove_deadline(self, expires_at: int) -> None:
+        """Drop one occurrence of a deadline from the sorted list."""
+        del self._deadlines[bisect_left(self._deadlines, expires_at)]
 
     def get(self, key: str) -> Any | None:
         """
@@ -57,17 +92,18 @@ class ConfigCache:
             Cached configuration or None if not found/expired
         """
         with self._lock:
-            if key not in self._cache:
+            entry = self._entries.get(key)
+            if entry is None:
                 return None
 
-            entry = self._cache[key]
-
             # Check expiration
-            if datetime.now().timestamp() > entry["expires_at"]:
-                del self._cache[key]
+            if self._now() > entry[1]:
+                del self._entries[key]
+                self._remove_deadline(entry[1])
                 return None
 
-            return entry["data"]
+            self._entries.move_to_end(key)
+            return entry[0]
 
     def set(self, key: str, data: Any, ttl: int | None = None) -> None:
         """
@@ -79,14 +115,51 @@ class ConfigCache:
             ttl: Time-to-live in seconds (uses default if None)
         """
         ttl = ttl or self.default_ttl
-        expires_at = datetime.now().timestamp() + ttl
+        expires_at = self._now() + int(ttl * 1_000_000_000)
 
         with self._lock:
-            self._cache[key] = {
-                "data": data,
-                "expires_at": expires_at,
-                "cached_at": datetime.now().timestamp(),
-            }
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._remove_deadline(previous[1])
+            elif len(self._entries) >= self.max_entries:
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self._remove_deadline(evicted[1])
+                self._stat_cache.pop(evicted_key, None)
+
+            self._entries[key] = (data, expires_at)
+            insort(self._deadlines, expires_at)
+
+    def get_if_unchanged(self, key: str, signature: tuple[Any, ...]) -> Any | None:
+        """
+        Get a parsed configuration if its file signature still matches.
+
+        Args:
+            key: Cache key (the configuration file path)
+            signature: Current file signature, e.g. (mtime_ns, size, ...)
+
+        Returns:
+            Cached configuration or None if missing or the file changed
+        """
+        with self._lock:
+            entry = self._stat_cache.get(key)
+            if entry is None or entry[0] != signature:
+                return None
+            self._stat_cache.move_to_end(key)
+            return entry[1]
+
+    def set_with_signature(self, key: str, signature: tuple[Any, ...], data: Any) -> None:
+        """
+        Remember a parsed configuration together with its file signature.
+
+        Args:
+            key: Cache key (the configuration file path)
+            signature: File signature the data was parsed from
+            data: Parsed configuration
+        """
+        with self._lock:
+            if self._stat_cache.pop(key, None) is None and len(self._stat_cache) >= self.max_entries:
+                self._stat_cache.popitem(last=False)
+            self._stat_cache[key] = (signature, data)
 
     def invalidate(self, key: str) -> None:
         """
@@ -96,30 +169,28 @@ class ConfigCache:
             key: Cache key to invalidate
         """
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._remove_deadline(entry[1])
+            self._stat_cache.pop(key, None)
 
     def clear(self) -> None:
         """Clear all cached configurations."""
         with self._lock:
-            self._cache.clear()
+            self._entries.clear()
+            self._deadlines.clear()
+            self._stat_cache.clear()
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
         with self._lock:
-            now = datetime.now().timestamp()
-            active_entries = 0
-            expired_entries = 0
-
-            for entry in self._cache.values():
-                if now <= entry["expires_at"]:
-                    active_entries += 1
-                else:
-                    expired_entries += 1
+            now = self._now()
+            total_entries = len(self._entries)
+            expired_entries = bisect_left(self._deadlines, now)
 
             return {
-                "total_entries": len(self._cache),
-                "active_entries": active_entries,
+                "total_entries": total_entries,
+                "active_entries": total_entries - expired_entries,
                 "expired_entries": expired_entries,
                 "cache_hit_ratio": getattr(self, "_hit_ratio", 0.0),
             }
@@ -134,16 +205,21 @@ class ConfigurationError(Exception):
 class ConfigLoader:
     """Configuration loader with caching and validation."""
 
-    def __init__(self, base_path: str | Path | None = None):
+    def __init__(
+        self,
+        base_path: str | Path | None = None,
+        path_resolver: PathResolver | None = None,
+    ) -> None:
         """
         Initialize configuration loader.
 
         Args:
             base_path: Base path for configuration files (optional, uses dynamic path if not provided)
+            path_resolver: Resolver used when base_path is omitted (a new PathResolver by default)
         """
         # Initialize path management
         self.path_config_manager = PathConfigManager()
-        self.path_resolver = PathResolver()
+        self.path_resolver = path_resolver if path_resolver is not None else PathResolver()
 
         # Use dynamic path if not provided
         if base_path is None:
@@ -205,15 +281,36 @@ class ConfigLoader:
                     self.logger.debug(f"Using cached configuration: {filename}")
                     return cached_config
 
-            # Load raw data with security validation
-            raw_data = self._load_raw_config_secure(file_path)
-
             # Determine model class
             if model_class is None:
                 model_class = self._config_types.get(filename)
                 if model_class is None:
                     raise ConfigurationError(f"No model class defined for {filename}")
 
+            # An unchanged file (same mtime and size) needs no read or parse
+            stat_key = str(file_path)
+            signature = None
+            if use_cache:
+                try:
+                    file_stat = file_path.stat()
+                except OSError:
+                    pass
+                else:
+                    signature = (
+                        file_stat.st_mtime_ns,
+                        file_stat.st_size,
+                        model_class,
+                        validate_schema,
+                    )
+                    cached_config = self.cache.get_if_unchanged(stat_key, signature)
+                    if cached_config is not None:
+                        self.logger.debug(f"Configuration unchanged on disk: {filename}")
+                        cache_manager.set(cache_key, cached_config, "file", ttl=300)
+                        return cached_config
+
+            # Load raw data with security validation
+            raw_data = self._load_raw_config_secure(file_path)
+
             # Validate and create model instance
             if validate_schema and filename != "platform_mapping.json":
                 config_instance = self._validate_and_create(
@@ -232,6 +329,8 @@ class ConfigLoader:
             # Cache the result with enhanced cache manager
             if use_cache:
                 cache_manager.set(cache_key, config_instance, "file", ttl=300)  # 5 minutes TTL
+                if signature is not None:
+                    self.cache.set_with_signature(stat_key, signature, config_instance)
 
             self.logger.info(f"Loaded configuration: {filename}")
             return config_instance
@@ -275,7 +374,7 @@ class ConfigLoader:
 
             # Parse JSON with security considerations
             try:
-                return json.loads(file_content)
+                return loads_json(file_content)
             except json.JSONDecodeError as e:
                 raise ConfigurationError(f"Invalid JSON in configuration file {file_path}: {e}")
 
@@ -295,12 +394,24 @@ class ConfigLoader:
         configs = {}
         errors = {}
 
-        for filename, model_class in self._config_types.items():
-            try:
-                configs[filename] = self.load_config(filename, model_class, use_cache)
-            except ConfigurationError as e:
-                errors[filename] = str(e)
-                self.logger.warning(f"Failed to load {filename}: {e}")
+        # Files are independent, so their disk reads overlap in worker
+        # threads; results are still collected in registration order.
+        config_types = list(self._config_types.items())
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_LOAD_WORKERS, len(config_types) or 1),
+            thread_name_prefix="config-loader",
+        ) as executor:
+            futures = [
+                (filename, executor.submit(self.load_config, filename, model_class, use_cache))
+                for filename, model_class in config_types
+            ]
+
+            for filename, future in futures:
+                try:
+                    configs[filename] = future.result()
+                except ConfigurationError as e:
+                    errors[filename] = str(e)
+                    self.logger.warning(f"Failed to load {filename}: {e}")
 
         if errors:
             self.logger.warning(
@@ -359,19 +470,22 @@ class ConfigLoader:
             if backup and file_path.exists():
                 self._create_backup(file_path)
 
-            # Prepare data for saving
+            # Prepare data for saving; models serialize straight to JSON in
+            # pydantic-core without an intermediate dict
             if isinstance(config, BaseModel):
-                data = config.model_dump(exclude_none=True, by_alias=True)
+                payload = config.model_dump_json(
+                    indent=2, exclude_none=True, by_alias=True
+                ).encode("utf-8")
             else:
-                data = config
+                payload = dumps_json(config)
 
             # Ensure parent directory exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Write to temporary file first (atomic operation)
             temp_file = file_path.with_suffix(".tmp")
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(temp_file, "wb") as f:
+                f.write(payload)
 
             # Move to final location
             temp_file.replace(file_path)
@@ -392,8 +506,8 @@ class ConfigLoader:
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
 
         try:
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
+            with open(file_path, "rb") as f:
+                data = load_json_file(f)
 
             if not isinstance(data, dict):
                 raise ValueError(
@@ -410,9 +524,13 @@ class ConfigLoader:
     def _validate_and_create(
         self, data: dict[str, Any], model_class: type[T], filename: str
     ) -> T:
-        """Validate data against model and create instance."""
+        """Validate data against model and create instance.
+
+        model_validate goes straight to the core validator pydantic builds
+        once per model class, without repacking ``data`` as keyword args.
+        """
         try:
-            return model_class(**data)
+            return model_class.model_validate(data)
         except ValidationError as e:
             # Create detailed error message
             error_details = []
@@ -430,16 +548,17 @@ class ConfigLoader:
 
     def _create_backup(self, file_path: Path) -> Path:
         """Create backup of configuration file."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Microseconds keep back-to-back saves from overwriting each other's
+        # backup without scanning the directory for existing ones
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         backup_path = file_path.with_suffix(f".{timestamp}.bak")
 
         try:
             backup_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Copy file
-            import shutil
-
-            shutil.copy2(file_path, backup_path)
+            # Contents only: a backup does not need the original's metadata,
+            # and copyfile uses the in-kernel fast path (sendfile) on Linux
+            shutil.copyfile(file_path, backup_path)
 
             self.logger.debug(f"Created backup: {backup_path}")
             return backup_path
@@ -458,21 +577,38 @@ class ConfigLoader:
         files = []
 
         try:
-            for filename in self._config_types.keys():
+            # One directory listing covers every known file; on Windows the
+            # entries already carry their stat data
+            try:
+                with os.scandir(self.base_path) as it:
+                    entries = {os.path.normcase(entry.name): entry for entry in it}
+            except OSError:
+                entries = None
+
+            for filename, model_class in self._config_types.items():
                 file_path = self.base_path / filename
 
+                try:
+                    if entries is not None and file_path.name == filename:
+                        entry = entries.get(os.path.normcase(filename))
+                        stat = entry.stat() if entry is not None else None
+                    else:
+                        # Nested names or an unreadable directory
+                        stat = file_path.stat()
+                except OSError:
+                    stat = None
+
                 file_info = {
                     "filename": filename,
                     "path": str(file_path),
-                    "exists": file_path.exists(),
-                    "model_class": self._config_types[filename].__name__,
+                    "exists": stat is not None,
+                    "model_class": model_class.__name__,
                     "size": 0,
                     "modified": None,
                     "cached": self.cache.get(str(file_path)) is not None,
                 }
 
-                if file_path.exists():
-                    stat = file_path.stat()
+                if stat is not None:
                     file_info.update(
                         {
                             "size": stat.st_size,
@@ -5,6 +5,7 @@ Janela principal modernizada para o SD Emulation GUI seguindo
 as especificações de UI/UX e Clean Architecture.
 """
 
+import os
 import sys
 from typing import Optional, Dict, Any
 
@@ -308,9 +309,25 @@ class SystemWorker(QThread):
 class MainWindow(QMainWindow):
     """Janela principal modernizada do FrontEmu Tools."""
 
-    def __init__(self, container: Optional[DependencyContainer] = None):
-        """Inicializa a janela principal."""
+    def __init__(
+        self,
+        container: Optional[DependencyContainer] = None,
+        skip_visual: Optional[bool] = None,
+    ):
+        """Inicializa a janela principal.
+
+        Args:
+            container: Container de dependências (usa o global se omitido)
+            skip_visual: Adia a aplicação das folhas de estilo até o primeiro
+                ``show()``. Por padrão é ativado quando ``QT_QPA_PLATFORM`` é
+                ``offscreen``, onde nada chega a ser desenhado.
+        """
         super().__init__()
+
+        if skip_visual is None:
+            skip_visual = os.environ.get("QT_QPA_PLATFORM") == "offscreen"
+        self._skip_visual = skip_visual
+        self._deferred_styles: Dict[QWidget, str] = {}
         
         # Container de dependências
         self.container = container or get_container()
@@ -361,7 +378,7 @@ class MainWindow(QMainWindow):
         """Cria header moderno."""
         header_frame = QFrame()
         header_frame.setFixedHeight(80)
-        header_frame.setStyleSheet("""
+        self._set_style(header_frame, """
             QFrame {
                 background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
                     stop:0 #32CD32, stop:1 #28a428);
@@ -374,7 +391,7 @@ class MainWindow(QMainWindow):
 
         # Logo e título
         title_label = QLabel("🚀 FrontEmu Tools")
-        title_label.setStyleSheet("""
+        self._set_style(title_label, """
             QLabel {
                 color: white;
                 font-size: 24px;
@@ -389,7 +406,7 @@ class MainWindow(QMainWindow):
 
         # Indicador de status
         self.status_indicator = QLabel("🟢 Sistema Ativo")
-        self.status_indicator.setStyleSheet("""
+        self._set_style(self.status_indicator, """
             QLabel {
                 color: white;
                 font-size: 14px;
@@ -407,7 +424,7 @@ class MainWindow(QMainWindow):
         """Cria área de conteúdo moderna."""
         # Container para o conteúdo
         content_frame = QFrame()
-        content_frame.setStyleSheet("""
+        self._set_style(content_frame, """
             QFrame {
                 background-color: #f8f9fa;
                 border: none;
@@ -419,7 +436,7 @@ class MainWindow(QMainWindow):
 
         # Tab widget moderno
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet("""
+        self._set_style(self.tab_widget, """
             QTabWidget::pane {
                 border: 1px solid #e9ecef;
                 border-radius: 8px;
@@ -473,7 +490,7 @@ class MainWindow(QMainWindow):
         """Cria footer moderno."""
         footer_frame = QFrame()
         footer_frame.setFixedHeight(40)
-        footer_frame.setStyleSheet("""
+        self._set_style(footer_frame, """
             QFrame {
                 background-color: #343a40;
                 border: none;
@@ -485,7 +502,7 @@ class MainWindow(QMainWindow):
 
         # Status da aplicação
         self.app_status_label = QLabel("Pronto")
-        self.app_status_label.setStyleSheet("""
+        self._set_style(self.app_status_label, """
             QLabel {
                 color: #adb5bd;
                 font-size: 12px;
@@ -498,7 +515,7 @@ class MainWindow(QMainWindow):
 
         # Versão
         version_label = QLabel("v1.0.0")
-        version_label.setStyleSheet("""
+        self._set_style(version_label, """
             QLabel {
                 color: #6c757d;
                 font-size: 12px;
@@ -511,7 +528,7 @@ class MainWindow(QMainWindow):
     def _setup_modern_style(self) -> None:
         """Configura estilo moderno da aplicação."""
         # Aplicar estilo global
-        self.setStyleSheet("""
+        self._set_style(self, """
             QMainWindow {
                 background-color: #f8f9fa;
             }
@@ -536,6 +553,21 @@ class MainWindow(QMainWindow):
         # Configurar acessibilidade
         self._setup_accessibility()
 
+    def _set_style(self, widget: QWidget, style: str) -> None:
+        """Aplica a folha de estilo agora ou a guarda para o primeiro show()."""
+        if self._skip_visual:
+            self._deferred_styles[widget] = style
+        else:
+            widget.setStyleSheet(style)
+
+    def showEvent(self, event) -> None:
+        """Aplica os estilos adiados antes da primeira exibição."""
+        if self._deferred_styles:
+            styles, self._deferred_styles = self._deferred_styles, {}
+            for widget, style in styles.items():
+                widget.setStyleSheet(style)
+        super().showEvent(event)
+
     def _setup_accessibility(self) -> None:
         """Configura recursos de acessibilidade."""
         # Atalhos de teclado
@@ -557,7 +589,7 @@ class MainWindow(QMainWindow):
     def _setup_modern_menu(self) -> None:
         """Configura menu moderno."""
         menubar = self.menuBar()
-        menubar.setStyleSheet("""
+        self._set_style(menubar, """
             QMenuBar {
                 background-color: white;
                 color: #495057;
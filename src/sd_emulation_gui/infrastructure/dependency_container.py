@@ -5,8 +5,9 @@ Container de injeção de dependências que configura e fornece
 todas as dependências da aplicação seguindo Clean Architecture.
 """
 
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 import logging
+import threading
 
 from ..domain.use_cases import (
     # Use Cases
@@ -65,6 +66,10 @@ class DependencyContainer:
         """Inicializa o container de dependências."""
         self.config = config or {}
         self._instances: Dict[str, Any] = {}
+        # Fábricas de serviços criados apenas no primeiro acesso
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        # Serializa a criação preguiçosa; workers QThread compartilham o container
+        self._resolve_lock = threading.Lock()
         self._logger = logging.getLogger(__name__)
         
         # Configurar banco de dados
@@ -178,30 +183,45 @@ class DependencyContainer:
         )
     
     def _register_legacy_services(self):
-        """Registra serviços legados para compatibilidade."""
-        try:
-            # SystemInfoService existente
-            self._instances['system_info_service'] = SystemInfoService()
-            
-            # DriveDetectionService existente
-            self._instances['drive_detection_service'] = DriveDetectionService()
-            
-            # ConfigurationService existente
-            self._instances['configuration_service'] = ConfigurationService()
+        """Registra serviços legados para compatibilidade.
+        
+        Os serviços só são instanciados no primeiro acesso, pois sua
+        construção consulta drives e estatísticas do sistema.
+        """
+        self._factories['system_info_service'] = SystemInfoService
+        self._factories['drive_detection_service'] = DriveDetectionService
+        self._factories['configuration_service'] = ConfigurationService
+        self._factories['system_stats_service'] = SystemStatsService
+    
+    def _resolve(self, service_name: str) -> Optional[Any]:
+        """Obtém a instância, criando-a a partir da fábrica se necessário."""
+        instance = self._instances.get(service_name)
+        if instance is not None:
+            return instance
+        
+        with self._resolve_lock:
+            instance = self._instances.get(service_name)
+            if instance is not None or service_name not in self._factories:
+                return instance
             
-            # SystemStatsService existente
-            self._instances['system_stats_service'] = SystemStatsService()
+            try:
+                instance = self._factories[service_name]()
+            except Exception as e:
+                self._logger.warning(f"Erro ao criar serviço legado '{service_name}': {e}")
+                # Continuar sem o serviço; a fábrica é mantida para nova tentativa
+                return None
             
-        except Exception as e:
-            self._logger.warning(f"Erro ao registrar serviços legados: {e}")
-            # Continuar sem os serviços legados se houver erro
+            self._instances[service_name] = instance
+            del self._factories[service_name]
+            return instance
     
     def get(self, service_name: str) -> Any:
         """Obtém uma instância de serviço."""
-        if service_name not in self._instances:
+        instance = self._resolve(service_name)
+        if instance is None and service_name not in self._instances:
             raise ValueError(f"Serviço '{service_name}' não encontrado no container")
         
-        return self._instances[service_name]
+        return instance
     
     def get_drive_repository(self) -> DriveRepository:
         """Obtém repositório de drives."""
@@ -283,36 +303,39 @@ class DependencyContainer:
     # Serviços legados (para compatibilidade)
     def get_system_info_service(self) -> Optional[SystemInfoService]:
         """Obtém serviço de informações do sistema (legacy)."""
-        return self._instances.get('system_info_service')
+        return self._resolve('system_info_service')
     
     def get_drive_detection_service(self) -> Optional[DriveDetectionService]:
         """Obtém serviço de detecção de drives (legacy)."""
-        return self._instances.get('drive_detection_service')
+        return self._resolve('drive_detection_service')
     
     def get_configuration_service(self) -> Optional[ConfigurationService]:
         """Obtém serviço de configuração (legacy)."""
-        return self._instances.get('configuration_service')
+        return self._resolve('configuration_service')
     
     def get_system_stats_service(self) -> Optional[SystemStatsService]:
         """Obtém serviço de estatísticas do sistema (legacy)."""
-        return self._instances.get('system_stats_service')
+        return self._resolve('system_stats_service')
     
     def register_instance(self, name: str, instance: Any):
         """Registra uma instância personalizada."""
-        self._instances[name] = instance
+        with self._resolve_lock:
+            self._instances[name] = instance
+            self._factories.pop(name, None)
         self._logger.debug(f"Instância '{name}' registrada no container")
     
     def has_service(self, service_name: str) -> bool:
         """Verifica se um serviço está registrado."""
-        return service_name in self._instances
+        return service_name in self._instances or service_name in self._factories
     
     def list_services(self) -> list[str]:
         """Lista todos os serviços registrados."""
-        return list(self._instances.keys())
+        return [*self._instances, *self._factories]
     
     def clear(self):
         """Limpa todas as instâncias do container."""
         self._instances.clear()
+        self._factories.clear()
         self._logger.info("Container de dependências limpo")
     
     def shutdown(self):
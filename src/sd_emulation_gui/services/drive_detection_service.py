@@ -292,10 +292,11 @@ class DriveDetectionService(BaseService):
     
     def _is_cache_valid(self) -> bool:
         """Verifica se o cache ainda é válido."""
-        if not self._cache_timestamp:
+        if self._cache_timestamp is None:
             return False
         
-        elapsed = time.time() - self._cache_timestamp
+        # Relógio monotônico: ajustes do relógio do sistema não afetam o TTL
+        elapsed = time.monotonic() - self._cache_timestamp
         return elapsed < self._cache_duration
     
     def _refresh_drives_cache(self) -> None:
@@ -357,7 +358,7 @@ class DriveDetectionService(BaseService):
                 self._notify_drive_changes(self._drives_cache, new_drives)
             
             self._drives_cache = new_drives
-            self._cache_timestamp = time.time()
+            self._cache_timestamp = time.monotonic()
             
             self.logger.debug(f"Cache de drives atualizado: {len(new_drives)} drives detectados")
             
@@ -109,6 +109,11 @@ except (AttributeError, NameError):
     # Fallback for when utils module or FileUtils class is not available
     class FileUtils:  # type: ignore
         pass
+
+# Step actions that may need administrator privileges on Windows
+ADMIN_ACTIONS = frozenset({"create_symlink", "move_file"})
+
+
 class MigrationStep:
     """Individual migration step with details and rollback information."""
 
@@ -548,7 +553,7 @@ class MigrationService(BaseService):
             return False
         
         # Check if this migration requires admin privileges (has symlinks or file operations)
-        requires_admin = any(step.action in ["create_symlink", "move_file"] for step in plan.steps)
+        requires_admin = any(step.action in ADMIN_ACTIONS for step in plan.steps)
         
         if requires_admin and sys.platform == "win32":
             if not is_admin():
@@ -1553,7 +1558,7 @@ class MigrationService(BaseService):
             simulated_steps += 1
 
             # Add warnings for risky operations
-            if step.action in ["create_symlink", "move_file"]:
+            if step.action in ADMIN_ACTIONS:
                 preview["warnings"].append(
                     f"Step {step.step_id}: {step.action} may require administrator privileges on Windows"
                 )
@@ -7,7 +7,7 @@ e monitoramento de recursos do sistema para garantir operações seguras.
 
 import asyncio
 import logging
-from datetime import datetime
+import time
 from typing import Any, Dict, List, Optional, Tuple
 
 # Import centralized systems
@@ -167,10 +167,11 @@ class SystemInfoService(BaseService):
     
     def _is_cache_valid(self) -> bool:
         """Verifica se o cache ainda é válido."""
-        if not self._cache_timestamp:
+        if self._cache_timestamp is None:
             return False
         
-        elapsed = (datetime.now() - self._cache_timestamp).total_seconds()
+        # Relógio monotônico: ajustes do relógio do sistema não afetam o TTL
+        elapsed = time.monotonic() - self._cache_timestamp
         return elapsed < self._cache_duration
     
     def _refresh_cache(self) -> None:
@@ -178,7 +179,7 @@ class SystemInfoService(BaseService):
         try:
             self._system_info_cache = SystemUtils.get_system_info()
             self._drives_cache = self._get_drives_info()
-            self._cache_timestamp = datetime.now()
+            self._cache_timestamp = time.monotonic()
             
             self.logger.debug("Cache de informações do sistema atualizado")
             
@@ -10,6 +10,7 @@ import locale
 import os
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple, Optional
 
@@ -18,8 +19,13 @@ class AdminUtils:
     """Utilities for managing administrative privileges on Windows."""
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def is_admin() -> bool:
-        """Check if the current process is running with administrative privileges."""
+        """Check if the current process is running with administrative privileges.
+
+        The elevation state cannot change within a process, so the result is
+        cached; see clear_cache.
+        """
         if sys.platform != "win32":
             return True  # Assume admin on non-Windows systems
         
@@ -29,6 +35,7 @@ class AdminUtils:
             return False
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_everyone_account_name() -> str:
         """Get the localized name for the 'Everyone' account based on system language."""
         try:
@@ -50,6 +57,12 @@ class AdminUtils:
         except Exception:
             return "Everyone"  # Fallback to English
     
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget cached privilege and account name lookups."""
+        AdminUtils.is_admin.cache_clear()
+        AdminUtils.get_everyone_account_name.cache_clear()
+
     @staticmethod
     def restart_as_admin(script_path: Optional[str] = None) -> bool:
         """
@@ -369,6 +382,11 @@ def get_everyone_account() -> str:
     return AdminUtils.get_everyone_account_name()
 
 
+def clear_admin_cache() -> None:
+    """Clear cached admin status and account name."""
+    AdminUtils.clear_cache()
+
+
 def run_as_admin(command: list, timeout: int = 30) -> Tuple[bool, str, str]:
     """Run command with admin privileges."""
     return AdminUtils.run_elevated_command(command, timeout)
\ No newline at end of file
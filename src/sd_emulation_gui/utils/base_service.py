@@ -83,6 +83,20 @@ class BaseService:
         max_depth: int | None = None,
         **_: Any,
     ) -> None:
+        # ``depth`` é apenas um contador de guarda repassado por quem constrói
+        # serviços aninhados; nada aqui é reentrante. A checagem vem antes de
+        # qualquer outra inicialização para falhar sem custo adicional.
+        if depth is not None:
+            recursion_depth = depth
+        if max_depth is not None:
+            max_recursion_depth = max_depth
+        max_recursion_depth = max_recursion_depth or self.BASE_DEFAULT_RECURSION_DEPTH
+        if recursion_depth > max_recursion_depth:
+            raise RecursionError("Max recursion depth exceeded")
+
+        self._max_recursion_depth = max_recursion_depth
+        self._recursion_depth = recursion_depth
+
         self.logger_name = logger_name or self.__class__.__qualname__
         self._logger: logging.Logger | None = None
 
@@ -95,17 +109,6 @@ class BaseService:
         self._cache: dict[str, Any] = {}
         self._is_initialized = False
 
-        if depth is not None:
-            recursion_depth = depth
-        if max_depth is not None:
-            max_recursion_depth = max_depth
-
-        self._max_recursion_depth = max_recursion_depth or self.BASE_DEFAULT_RECURSION_DEPTH
-        self._recursion_depth = recursion_depth
-
-        if self._recursion_depth > self._max_recursion_depth:
-            raise RecursionError("Max recursion depth exceeded")
-
         self._initialize()
 
     # ------------------------------------------------------------------
@@ -61,12 +61,12 @@ class FileUtils:
     @staticmethod
     def file_exists(path: str) -> bool:
         """Check if file exists."""
-        return os.path.exists(path) and os.path.isfile(path)
+        return os.path.isfile(path)
 
     @staticmethod
     def directory_exists(path: str) -> bool:
         """Check if directory exists."""
-        return os.path.exists(path) and os.path.isdir(path)
+        return os.path.isdir(path)
 
     @staticmethod
     def get_file_size(path: str) -> int:
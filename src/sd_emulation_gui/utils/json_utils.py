@@ -0,0 +1,54 @@
+"""
+JSON Utilities Module
+
+This module provides JSON parsing and serialization helpers for the SD
+Emulation GUI application, using orjson when it is installed.
+"""
+
+import json
+import mmap
+import os
+from typing import Any, BinaryIO
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+# Above this size orjson parses straight from a memory map instead of a copy
+# of the file read into a bytes object.
+JSON_MMAP_THRESHOLD = 1024 * 1024
+
+
+def loads_json(data: bytes | str) -> Any:
+    """Parse JSON with orjson when available.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers handle
+    both parsers with the same except clause.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json_file(f: BinaryIO) -> Any:
+    """Parse an open binary JSON file, memory-mapping large ones."""
+    if orjson is not None and os.fstat(f.fileno()).st_size >= JSON_MMAP_THRESHOLD:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release()
+    return loads_json(f.read())
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON, with orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # e.g. non-str keys or ints beyond 64 bits; stdlib json copes
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
@@ -101,6 +101,32 @@ class PathUtils:
             info["modified_time"] = stat.st_mtime
         return info
 
+    @staticmethod
+    def get_path_info_from_entry(entry: os.DirEntry) -> dict[str, Any]:
+        """Build the same info as get_path_info from an os.scandir entry.
+
+        Reuses the entry's cached type/stat data instead of building a Path
+        and re-stating it, which matters when walking large directories.
+        """
+        name = entry.name
+        base, dot, ext = name.rpartition(".")
+        has_suffix = bool(dot and base and ext)
+        is_file = entry.is_file()
+        info = {
+            "path": PathUtils.normalize_path(entry.path),
+            "name": name,
+            "stem": base if has_suffix else name,
+            "suffix": f".{ext}" if has_suffix else "",
+            "exists": True,
+            "is_file": is_file,
+            "is_dir": entry.is_dir(),
+        }
+        if is_file:
+            stat = entry.stat()
+            info["size"] = stat.st_size
+            info["modified_time"] = stat.st_mtime
+        return info
+
     @staticmethod
     def sanitize_input_path(path: str) -> str:
         if path is None or path == "":
@@ -176,7 +202,7 @@ class PathUtils:
 
     @staticmethod
     def directory_exists(path: str) -> bool:
-        return os.path.exists(path) and os.path.isdir(path)
+        return os.path.isdir(path)
 
     @staticmethod
     def is_directory(path: str | Path) -> bool:
@@ -207,7 +233,7 @@ class PathUtils:
 
     @staticmethod
     def file_exists(path: str) -> bool:
-        return os.path.exists(path) and os.path.isfile(path)
+        return os.path.isfile(path)
 
     @staticmethod
     def validate_safe_path(path: str, base_path: str) -> bool:
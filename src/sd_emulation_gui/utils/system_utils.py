@@ -7,15 +7,34 @@ import logging
 import os
 import platform
 import psutil
+import re
 import shutil
 import subprocess
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .admin_utils import is_admin
 
+# Comandos em string só dispensam o shell quando são palavras simples
+# separadas por espaço; qualquer outra sintaxe (aspas, globs, comentários,
+# quebras de linha, atribuições VAR=x, %VAR% do cmd...) continua indo
+# para o shell.
+_SIMPLE_COMMAND_RE = re.compile(r"[\w./:@+,-]+( [\w./:@+,-]+)*")
+
+
+def _prepare_command(command: Union[str, List[str]]) -> Tuple[Union[str, List[str]], bool]:
+    """Converte o comando em argumentos e decide se um shell é necessário."""
+    if not isinstance(command, str):
+        return [str(arg) for arg in command], False
+
+    if _SIMPLE_COMMAND_RE.fullmatch(command) is None:
+        return command, True
+
+    # No Windows o CreateProcess recebe a linha de comando original
+    return (command if os.name == "nt" else command.split(" ")), False
+
 
 class SystemUtils:
     """Utilities for system operations and information gathering."""
@@ -201,25 +220,37 @@ class SystemUtils:
             return {"error": str(e)}
 
     @staticmethod
-    def execute_command(command: str, timeout: int = 30) -> Tuple[bool, str, str]:
+    def execute_command(
+        command: Union[str, List[str]], timeout: int = 30
+    ) -> Tuple[bool, str, str]:
         """
         Executa um comando do sistema.
         
+        Comandos simples são executados diretamente, sem um shell intermediário;
+        qualquer outra sintaxe (pipes, redirecionamentos, aspas, variáveis ou
+        comandos internos) continua sendo executada pelo shell padrão.
+        
         Args:
-            command: Comando a ser executado
+            command: Comando a ser executado (string ou lista de argumentos)
             timeout: Timeout em segundos
             
         Returns:
             Tupla (sucesso, stdout, stderr)
         """
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+            args, use_shell = _prepare_command(command)
+            try:
+                result = subprocess.run(
+                    args, shell=use_shell, capture_output=True, text=True, timeout=timeout
+                )
+            except FileNotFoundError:
+                if use_shell or not isinstance(command, str):
+                    raise
+                # Comandos internos do shell (cd, echo no Windows, ...) não
+                # estão no PATH; o shell os resolve
+                result = subprocess.run(
+                    command, shell=True, capture_output=True, text=True, timeout=timeout
+                )
             return result.returncode == 0, result.stdout, result.stderr
         except subprocess.TimeoutExpired:
             return False, "", f"Command timed out after {timeout} seconds"
@@ -6,20 +6,113 @@ This module provides validation utilities for the SD Emulation GUI application.
 
 import json
 import os
-from typing import Any, Dict, List, NamedTuple
+import stat
+import sys
+from enum import Enum
+from functools import lru_cache
+from itertools import compress
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple
 import re
 
+from .json_utils import load_json_file, loads_json
+
+
+# Backreferences depend on group numbering, which changes when patterns are
+# merged into a single alternation.
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+@lru_cache(maxsize=512)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+@lru_cache(maxsize=128)
+def _partition_patterns(patterns: tuple[str, ...]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Split patterns into plain substrings and real regular expressions."""
+    literals = tuple(p for p in patterns if _REGEX_METACHARACTERS.isdisjoint(p))
+    regexes = tuple(p for p in patterns if not _REGEX_METACHARACTERS.isdisjoint(p))
+    return literals, regexes
+
+
+def _pattern_matches(pattern: str, text: str) -> bool:
+    if _REGEX_METACHARACTERS.isdisjoint(pattern):
+        return pattern in text
+    return _compile_pattern(pattern).search(text) is not None
+
+
+@lru_cache(maxsize=128)
+def _compile_pattern_union(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Merge patterns into one alternation so a path is scanned only once."""
+    if any(_BACKREFERENCE.search(pattern) for pattern in patterns):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+    except re.error:
+        return None
+
+
+# Interned so status checks can compare by identity
+STATUS_VALID = sys.intern("valid")
+STATUS_WARNING = sys.intern("warning")
+STATUS_ERROR = sys.intern("error")
+
+
+class _PathKind(Enum):
+    MISSING = "missing"
+    FILE = "file"
+    DIR = "dir"
+    OTHER = "other"
+
+
+def _stat_kind(path: str) -> _PathKind:
+    """Classify a path with a single stat call, answering "exists" and "kind"."""
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        return _PathKind.MISSING
+    if stat.S_ISREG(mode):
+        return _PathKind.FILE
+    if stat.S_ISDIR(mode):
+        return _PathKind.DIR
+    return _PathKind.OTHER
+
 
 class ValidationResult:
     """Rich validation result supporting GUI, tests and reporting."""
 
+    # Created for every check and in aggregation loops; slots keep instances
+    # small and attribute access cheap.
+    __slots__ = (
+        "file_path",
+        "message",
+        "details",
+        "_status",
+        "_is_valid",
+        "errors",
+        "warnings",
+        "info",
+        "metrics",
+        "schema_valid",
+        "schema_errors",
+        "cross_reference_valid",
+        "cross_reference_errors",
+        "cross_reference_warnings",
+        "validation_details",
+        "suggested_actions",
+    )
+
     def __init__(
         self,
         file_path: str | None = None,
         message: str = "",
         details: Dict[str, Any] | None = None,
         *,
-        status: str = "valid",
+        status: str = STATUS_VALID,
         errors: List[str] | None = None,
         warnings: List[str] | None = None,
         info: List[str] | None = None,
@@ -33,36 +126,55 @@ class ValidationResult:
         suggested_actions: List[str] | None = None,
         is_valid: bool | None = None,
     ) -> None:
-        if isinstance(file_path, bool):
-            status = "valid" if file_path else "error"
+        # Legacy positional form: ValidationResult(True, "message").
+        # Identity checks keep the common str/None arguments off isinstance.
+        if file_path is True or file_path is False:
+            status = STATUS_VALID if file_path else STATUS_ERROR
             file_path = None
-        if isinstance(message, bool):
-            status = "valid" if message else "error"
+        if message is True or message is False:
+            status = STATUS_VALID if message else STATUS_ERROR
             message = ""
         if is_valid is not None:
-            status = "valid" if is_valid else "error"
+            status = STATUS_VALID if is_valid else STATUS_ERROR
+        elif status is not STATUS_VALID:
+            status = sys.intern(status)
         self.file_path = file_path
         self.message = message
-        self.details: Dict[str, Any] = details or {}
-        self.status = status
+        self._status = status
+        self._is_valid = status is STATUS_VALID
+        self.schema_valid = schema_valid
+        self.cross_reference_valid = cross_reference_valid
         self.errors: List[str] = errors or []
         self.warnings: List[str] = warnings or []
         self.info: List[str] = info or []
         self.metrics: Dict[str, Any] = metrics or {}
-        self.schema_valid = schema_valid
         self.schema_errors: List[str] = schema_errors or []
-        self.cross_reference_valid = cross_reference_valid
         self.cross_reference_errors: List[str] = cross_reference_errors or []
         self.cross_reference_warnings: List[str] = cross_reference_warnings or []
         self.validation_details: Dict[str, Any] = validation_details or {}
         self.suggested_actions: List[str] = suggested_actions or []
-        if "message" in self.details and not self.message:
-            self.message = self.details.get("message", "")
+        if details:
+            self.details: Dict[str, Any] = details
+            if not message and "message" in details:
+                self.message = details.get("message", "")
+        else:
+            self.details = {}
+
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @status.setter
+    def status(self, value: str) -> None:
+        # is_valid is read far more often than status changes, so keep the
+        # flag in step here instead of comparing strings on every read
+        self._status = value = sys.intern(value)
+        self._is_valid = value is STATUS_VALID
 
     # Compatibility properties expected by tests
     @property
     def is_valid(self) -> bool:  # type: ignore[override]
-        return self.status == "valid"
+        return self._is_valid
     
     @is_valid.setter
     def is_valid(self, value: bool) -> None:
@@ -70,12 +182,12 @@ class ValidationResult:
         if value:
             # Only set to valid if there are no errors
             if not self.errors:
-                self.status = "valid"
+                self.status = STATUS_VALID
             else:
                 # Keep error status if there are errors
-                self.status = "error"
+                self.status = STATUS_ERROR
         else:
-            self.status = "error"
+            self.status = STATUS_ERROR
 
     @property
     def has_errors(self) -> bool:
@@ -96,7 +208,7 @@ class ValidationResult:
         if cross_reference:
             self.cross_reference_valid = False
             self.cross_reference_errors.append(error)
-        self.status = "error"
+        self.status = STATUS_ERROR
 
     def add_warning(self, warning: str, *, cross_reference: bool = False) -> None:
         self.warnings.append(warning)
@@ -104,8 +216,8 @@ class ValidationResult:
             self.message = warning
         if cross_reference:
             self.cross_reference_warnings.append(warning)
-        if self.status == "valid":
-            self.status = "warning"
+        if self._status is STATUS_VALID:
+            self.status = STATUS_WARNING
 
     def add_info(self, info: str) -> None:
         self.info.append(info)
@@ -123,32 +235,36 @@ class ValidationResult:
 
     # --- helpers ----------------------------------------------------------
 
+    @staticmethod
+    def _extend_unique(target: List[str], items: List[str]) -> None:
+        # Set built per call rather than kept on the instance: callers also
+        # assign and append to the public lists directly
+        seen = set(target)
+        for item in items:
+            if item not in seen:
+                seen.add(item)
+                target.append(item)
+
     def set_schema_valid(self, valid: bool, *, errors: List[str] | None = None) -> None:
         self.schema_valid = valid
         if errors:
             self.schema_errors.extend(errors)
             if not valid:
-                for err in errors:
-                    if err not in self.errors:
-                        self.errors.append(err)
-                self.status = "error"
+                self._extend_unique(self.errors, errors)
+                self.status = STATUS_ERROR
 
     def set_cross_reference_valid(self, valid: bool, *, errors: List[str] | None = None, warnings: List[str] | None = None) -> None:
         self.cross_reference_valid = valid
         if errors:
             self.cross_reference_errors.extend(errors)
             if not valid:
-                for err in errors:
-                    if err not in self.errors:
-                        self.errors.append(err)
-                self.status = "error"
+                self._extend_unique(self.errors, errors)
+                self.status = STATUS_ERROR
         if warnings:
             self.cross_reference_warnings.extend(warnings)
-            for warn in warnings:
-                if warn not in self.warnings:
-                    self.warnings.append(warn)
-            if self.status == "valid":
-                self.status = "warning"
+            self._extend_unique(self.warnings, warnings)
+            if self._status is STATUS_VALID:
+                self.status = STATUS_WARNING
 
     def has_warnings(self) -> bool:
         return bool(self.warnings)
@@ -156,7 +272,7 @@ class ValidationResult:
     def to_dict(self) -> Dict[str, Any]:
         return {
             "file_path": self.file_path,
-            "status": self.status,
+            "status": self._status,
             "errors": self.errors,
             "warnings": self.warnings,
             "info": self.info,
@@ -171,6 +287,31 @@ class ValidationResult:
         }
 
 
+@lru_cache(maxsize=64)
+def _schema_validator(schema_class: Any) -> Callable[[dict], Any]:
+    """Resolve how to validate data against schema_class, once per class."""
+    try:
+        from pydantic import BaseModel
+    except ImportError:
+        BaseModel = None
+
+    if (
+        BaseModel is not None
+        and isinstance(schema_class, type)
+        and issubclass(schema_class, BaseModel)
+    ):
+        return schema_class.model_validate
+    return lambda data: schema_class(**data)
+
+
+_get_is_valid_flag = attrgetter("_is_valid")
+
+
+def _empty_path_result() -> ValidationResult:
+    # A fresh instance each time: results are mutable and callers add to them
+    return ValidationResult(None, message="Empty path", status=STATUS_ERROR)
+
+
 class ValidationUtils:
     """Validation utility functions."""
 
@@ -180,24 +321,68 @@ class ValidationUtils:
 
     @staticmethod
     def validate_file_exists(path: str) -> ValidationResult:
-        result = ValidationResult(path, message="File exists")
         if not path:
-            return ValidationResult(None, message="Empty path", status="error")
-        if not os.path.exists(path):
-            return ValidationResult(path, message=f"File does not exist: {path}", status="error")
-        if not os.path.isfile(path):
-            return ValidationResult(path, message=f"Path is not a file: {path}", status="error")
+            return _empty_path_result()
+        return ValidationUtils._file_kind_result(path, _stat_kind(path))
+
+    @staticmethod
+    def validate_files_exist(paths: Iterable[str]) -> Dict[str, ValidationResult]:
+        """Validate many files, listing each shared parent directory only once."""
+        paths = list(paths)
+        by_parent: Dict[str, List[str]] = {}
+        for path in paths:
+            if path:
+                by_parent.setdefault(os.path.dirname(path) or os.curdir, []).append(path)
+
+        kinds: Dict[str, _PathKind] = {}
+        for parent, group in by_parent.items():
+            entries: Dict[str, os.DirEntry] = {}
+            if len(group) > 1:
+                try:
+                    with os.scandir(parent) as it:
+                        entries = {entry.name: entry for entry in it}
+                except OSError:
+                    pass
+            for path in group:
+                if path in kinds:
+                    # Repeated paths are answered once per batch call
+                    continue
+                entry = entries.get(os.path.basename(path))
+                if entry is not None and entry.is_file():
+                    kinds[path] = _PathKind.FILE
+                elif entry is not None and entry.is_dir():
+                    kinds[path] = _PathKind.DIR
+                else:
+                    # Not listed (case-insensitive filesystems, broken links,
+                    # single path in its directory): stat it directly
+                    kinds[path] = _stat_kind(path)
+
+        return {
+            path: ValidationUtils._file_kind_result(path, kinds[path])
+            if path
+            else _empty_path_result()
+            for path in paths
+        }
+
+    @staticmethod
+    def _file_kind_result(path: str, kind: _PathKind) -> ValidationResult:
+        if kind is _PathKind.MISSING:
+            return ValidationResult(path, message=f"File does not exist: {path}", status=STATUS_ERROR)
+        if kind is not _PathKind.FILE:
+            return ValidationResult(path, message=f"Path is not a file: {path}", status=STATUS_ERROR)
+        result = ValidationResult(path, message="File exists")
         result.add_info(f"File exists: {path}")
         return result
 
     @staticmethod
     def validate_directory_exists(path: str) -> ValidationResult:
         if not path:
-            return ValidationResult(None, message="Empty path", status="error")
-        if not os.path.exists(path):
-            return ValidationResult(path, message=f"Directory does not exist: {path}", status="error")
-        if not os.path.isdir(path):
-            return ValidationResult(path, message=f"Path is not a directory: {path}", status="error")
+            return _empty_path_result()
+        kind = _stat_kind(path)
+        if kind is _PathKind.MISSING:
+            return ValidationResult(path, message=f"Directory does not exist: {path}", status=STATUS_ERROR)
+        if kind is not _PathKind.DIR:
+            return ValidationResult(path, message=f"Path is not a directory: {path}", status=STATUS_ERROR)
         result = ValidationResult(path, message=f"Directory exists: {path}")
         result.add_info(f"Directory exists: {path}")
         return result
@@ -209,10 +394,10 @@ class ValidationUtils:
     @staticmethod
     def validate_path_length(path: str, max_length: int) -> ValidationResult:
         if not path:
-            return ValidationResult(None, message="Empty path", status="error")
+            return _empty_path_result()
         length = len(path)
         if length > max_length:
-            return ValidationResult(None, message=f"Path too long: {length} > {max_length}", status="error")
+            return ValidationResult(None, message=f"Path too long: {length} > {max_length}", status=STATUS_ERROR)
         result = ValidationResult(None, message="Path length is acceptable")
         result.add_metric("path_length", length)
         return result
@@ -225,8 +410,8 @@ class ValidationUtils:
     def validate_json_file(file_path: str) -> ValidationResult:
         result = ValidationResult(file_path, message=f"Validating JSON file: {file_path}")
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                json.load(f)
+            with open(file_path, "rb") as f:
+                load_json_file(f)
             success_msg = "valid JSON file"
             result.message = success_msg
             result.add_info(success_msg)
@@ -244,12 +429,12 @@ class ValidationUtils:
     @staticmethod
     def _validate_with_pydantic(data: dict, schema_class: Any) -> ValidationResult:
         try:
-            schema_class(**data)
+            _schema_validator(schema_class)(data)
             res = ValidationResult(None, message="Schema validation passed")
             res.add_info("Schema validation passed")
             return res
         except Exception as e:
-            res = ValidationResult(None, message=f"Schema validation failed: {e}", status="error")
+            res = ValidationResult(None, message=f"Schema validation failed: {e}", status=STATUS_ERROR)
             res.add_error(f"Schema validation failed: {e}", schema=True)
             return res
 
@@ -260,14 +445,14 @@ class ValidationUtils:
     @staticmethod
     def validate_json_syntax(json_str: str) -> ValidationResult:
         if not json_str:
-            return ValidationResult(None, message="Empty JSON string", status="error")
+            return ValidationResult(None, message="Empty JSON string", status=STATUS_ERROR)
         try:
-            json.loads(json_str)
+            loads_json(json_str)
             result = ValidationResult(None, message="valid JSON")
             result.add_info("valid JSON")
             return result
         except json.JSONDecodeError as e:
-            return ValidationResult(None, message=f"Invalid JSON syntax: {e}", status="error")
+            return ValidationResult(None, message=f"Invalid JSON syntax: {e}", status=STATUS_ERROR)
 
     # ------------------------------
     # Forbidden patterns / cross references
@@ -277,9 +462,15 @@ class ValidationUtils:
     def validate_forbidden_patterns(path: str, patterns: List[str]) -> ValidationResult:
         if not patterns:
             return ValidationResult(path, message="No patterns to check")
-        for pattern in patterns:
-            if re.search(pattern, path):
-                return ValidationResult(path, message=f"Forbidden pattern detected: {pattern}", status="error")
+        literals, regexes = _partition_patterns(tuple(patterns))
+        union = _compile_pattern_union(regexes) if regexes else None
+        if any(literal in path for literal in literals) or (
+            regexes and (union is None or union.search(path))
+        ):
+            # Report the first offending pattern in the caller's order
+            for pattern in patterns:
+                if _pattern_matches(pattern, path):
+                    return ValidationResult(path, message=f"Forbidden pattern detected: {pattern}", status=STATUS_ERROR)
         res = ValidationResult(path, message="No forbidden patterns detected")
         res.add_info("No forbidden patterns detected")
         return res
@@ -289,10 +480,11 @@ class ValidationUtils:
         references = config.get("references")
         if not references:
             return ValidationResult(None, message="No cross-references to validate")
-        fields = set(config.keys())
-        invalid = [ref for ref in references.values() if ref not in fields]
-        if invalid:
-            res = ValidationResult(None, message=f"Invalid cross-reference: {', '.join(invalid)}", status="error")
+        missing = set(references.values()).difference(config.keys())
+        if missing:
+            # Deterministic, de-duplicated order for the report
+            invalid = [ref for ref in dict.fromkeys(references.values()) if ref in missing]
+            res = ValidationResult(None, message=f"Invalid cross-reference: {', '.join(invalid)}", status=STATUS_ERROR)
             for ref in invalid:
                 res.add_error(f"Invalid cross-reference: {ref}", cross_reference=True)
             return res
@@ -305,45 +497,51 @@ class ValidationUtils:
     # ------------------------------
 
     @staticmethod
-    def combine_validation_results(results: List[ValidationResult]) -> ValidationResult:
+    def combine_validation_results(
+        results: List[ValidationResult], *, include_details: bool = True
+    ) -> ValidationResult:
+        """Merge results into one; include_details=False skips the per-result dicts."""
         if not results:
             return ValidationResult(None, message="No validations to combine")
         combined = ValidationResult(None, message="All validations passed")
-        combined.validation_details["individual_results"] = []
-        combined.details["individual_results"] = combined.validation_details["individual_results"]
+        if include_details:
+            combined.validation_details["individual_results"] = [res.to_dict() for res in results]
         failed = []
         for res in results:
-            combined.validation_details["individual_results"].append(res.to_dict())
             if not res.is_valid:
                 failed.append(res.message or res.file_path or "unknown")
         if failed:
-            combined.status = "error"
+            combined.status = STATUS_ERROR
             combined.message = f"{len(failed)} validation(s) failed"
             combined.validation_details["failed_validations"] = failed
-            combined.details["failed_validations"] = failed
         else:
             combined.add_info("All validations passed")
+        combined.details.update(combined.validation_details)
         return combined
 
     @staticmethod
     def create_validation_summary(results: Dict[str, ValidationResult]) -> ValidationResult:
         total = len(results)
-        passed = sum(1 for r in results.values() if r.is_valid)
+        try:
+            # Read the precomputed slot from C instead of a property per result
+            flags = list(map(_get_is_valid_flag, results.values()))
+        except AttributeError:  # result objects from other modules
+            flags = [res.is_valid for res in results.values()]
+        passed = sum(flags)
+        failed_names = list(compress(results, [not flag for flag in flags]))
         failed = total - passed
         summary = ValidationResult(None, message="Validation summary")
         summary.validation_details["total_validations"] = total
         summary.validation_details["passed_validations"] = passed
         summary.validation_details["failed_validations"] = failed
-        summary.validation_details["failed_validation_names"] = [
-            name for name, res in results.items() if not res.is_valid
-        ]
+        summary.validation_details["failed_validation_names"] = failed_names
         summary.details.update(summary.validation_details)
         if total == 0:
             summary.message = "No validations performed"
         elif failed == 0:
             summary.message = f"All {total} validations passed"
         else:
-            summary.status = "error"
+            summary.status = STATUS_ERROR
             summary.message = f"{failed} out of {total} validations failed"
         return summary
 
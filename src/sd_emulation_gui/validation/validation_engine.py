@@ -4,24 +4,106 @@ Centralized validation system to reduce code duplication
 and provide consistent validation across all modules.
 """
 
+import os
 import re
+import sys
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from interfaces.data_interfaces import OperationData
 from interfaces.service_interfaces import ValidationResult
 from utils.path_utils import PathUtils
 
+# Context key holding path lookups shared by the rules of one validation run
+PATH_INFO_CACHE_KEY = "__path_info_cache__"
+
+# Default patterns, compiled once at import rather than per engine instance
+_ALNUM_ID_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_ISO_TS_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+# Every form accepted by datetime.fromisoformat starts with a 4-digit year
+_ISO_YEAR_PREFIX_RE = re.compile(r"[0-9]{4}")
+
+
+def _is_iso_timestamp(value: Any) -> bool:
+    """Return True if value is a string datetime.fromisoformat accepts.
+
+    Values that cannot be ISO timestamps are rejected by a cheap prefix
+    match, so only plausible strings pay for parsing and its exception.
+    """
+    if not isinstance(value, str) or not _ISO_YEAR_PREFIX_RE.match(value):
+        return False
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_alphanumeric_id(value: Any) -> bool:
+    """Return True if value is a non-empty string of [a-zA-Z0-9_-] only.
+
+    Uses str methods implemented in C instead of the regex engine, which is
+    noticeably faster for the short strings IDs typically are.
+    """
+    if not isinstance(value, str) or not value or not value.isascii():
+        return False
+    stripped = value.replace("_", "").replace("-", "")
+    return not stripped or stripped.isalnum()
+
+
+def _is_fatal(result: ValidationResult) -> bool:
+    """Return True for a failed result of "error" severity."""
+    return not result["is_valid"] and result["severity"] == "error"
+
+
+@lru_cache(maxsize=256)
+def _compile_cached(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """Compile a user-supplied pattern, reusing earlier compilations."""
+    return re.compile(pattern, flags)
+
+
+# Timestamp shared by every result of a batch run (validate_group and friends)
+_batch_timestamp: ContextVar[str | None] = ContextVar(
+    "validation_batch_timestamp", default=None
+)
+
+
+def _validation_timestamp() -> str:
+    """Return the current batch timestamp, or now when not inside a batch."""
+    return _batch_timestamp.get() or datetime.now().isoformat()
+
+
+@contextmanager
+def _batch_timestamp_scope() -> Iterator[None]:
+    """Stamp all results created inside the block with a single timestamp."""
+    if _batch_timestamp.get() is not None:
+        yield
+        return
+    token = _batch_timestamp.set(datetime.now().isoformat())
+    try:
+        yield
+    finally:
+        _batch_timestamp.reset(token)
+
 
 class ValidationRule(ABC):
     """Base class for validation rules."""
 
+    __slots__ = ("rule_id", "description", "severity")
+
     def __init__(self, rule_id: str, description: str, severity: str = "error"):
-        self.rule_id = rule_id
+        # Interned so the many results produced by bulk runs share one copy
+        self.rule_id = sys.intern(rule_id)
         self.description = description
-        self.severity = severity
+        self.severity = sys.intern(severity)
 
     @abstractmethod
     def validate(self, target: Any, context: dict[str, Any] = None) -> ValidationResult:
@@ -45,13 +127,22 @@ class ValidationRule(ABC):
             severity=self.severity,
             details=details or {},
             suggested_fix=suggested_fix,
-            validation_timestamp=datetime.now().isoformat(),
+            validation_timestamp=_validation_timestamp(),
         )
 
 
 class PathValidationRule(ValidationRule):
     """Validation rule for file system paths."""
 
+    __slots__ = (
+        "must_exist",
+        "must_be_absolute",
+        "must_be_directory",
+        "must_be_file",
+        "allowed_extensions",
+        "_allowed_extensions_lower",
+    )
+
     def __init__(
         self,
         must_exist: bool = True,
@@ -66,6 +157,33 @@ class PathValidationRule(ValidationRule):
         self.must_be_directory = must_be_directory
         self.must_be_file = must_be_file
         self.allowed_extensions = allowed_extensions or []
+        self._allowed_extensions_lower = frozenset(
+            ext.lower() for ext in self.allowed_extensions
+        )
+
+    @staticmethod
+    def _get_path_info(
+        target: str, context: dict[str, Any] = None
+    ) -> tuple[bool, bool, bool | None, str | None]:
+        """Return (exists, is_absolute, is_directory, extension) for target.
+
+        Uses the per-run cache in context when present, so several path rules
+        validating the same target share one set of filesystem queries.
+        """
+        cache = context.get(PATH_INFO_CACHE_KEY) if context else None
+        if cache is not None and target in cache:
+            return cache[target]
+
+        exists = PathUtils.path_exists(target)
+        info = (
+            exists,
+            PathUtils.is_absolute_path(target),
+            PathUtils.is_directory(target) if exists else None,
+            os.path.splitext(target)[1] if exists else None,
+        )
+        if cache is not None:
+            cache[target] = info
+        return info
 
     def validate(self, target: str, context: dict[str, Any] = None) -> ValidationResult:
         """Validate a file system path."""
@@ -83,50 +201,45 @@ class PathValidationRule(ValidationRule):
                 False, "Path cannot be empty", target, {}, "Provide a non-empty path"
             )
 
+        # Query the filesystem once; every check below reuses these answers
+        exists, is_absolute, is_directory, extension = self._get_path_info(
+            target, context
+        )
+
         errors = []
 
         # Check if absolute
-        if self.must_be_absolute and not PathUtils.is_absolute(target):
+        if self.must_be_absolute and not is_absolute:
             errors.append("Path must be absolute")
 
         # Check if exists
-        if self.must_exist and not PathUtils.path_exists(target):
+        if self.must_exist and not exists:
             errors.append("Path does not exist")
 
         # Check if directory
-        if (
-            self.must_be_directory
-            and PathUtils.path_exists(target)
-            and not PathUtils.is_directory(target)
-        ):
+        if self.must_be_directory and exists and not is_directory:
             errors.append("Path must be a directory")
 
         # Check if file
-        if (
-            self.must_be_file
-            and PathUtils.path_exists(target)
-            and PathUtils.is_directory(target)
-        ):
+        if self.must_be_file and exists and is_directory:
             errors.append("Path must be a file")
 
         # Check file extension
-        if (
-            self.allowed_extensions
-            and PathUtils.path_exists(target)
-            and not PathUtils.is_directory(target)
-        ):
-            file_ext = PathUtils.get_file_extension(target).lower()
-            if file_ext not in [ext.lower() for ext in self.allowed_extensions]:
+        if self.allowed_extensions and exists and not is_directory:
+            file_ext = extension.lower()
+            if file_ext not in self._allowed_extensions_lower:
                 errors.append(
                     f"File extension '{file_ext}' not allowed. Allowed: {self.allowed_extensions}"
                 )
 
-        is_valid = len(errors) == 0
-        message = (
-            "Path validation passed"
-            if is_valid
-            else f"Path validation failed: {'; '.join(errors)}"
-        )
+        is_valid = not errors
+        if is_valid:
+            message = "Path validation passed"
+            suggested_fix = None
+        else:
+            joined = "; ".join(errors)
+            message = f"Path validation failed: {joined}"
+            suggested_fix = f"Fix path issues: {joined}"
 
         return self.create_result(
             is_valid,
@@ -135,27 +248,21 @@ class PathValidationRule(ValidationRule):
             {
                 "errors": errors,
                 "path_info": {
-                    "exists": PathUtils.path_exists(target),
-                    "is_absolute": PathUtils.is_absolute(target),
-                    "is_directory": (
-                        PathUtils.is_directory(target)
-                        if PathUtils.path_exists(target)
-                        else None
-                    ),
-                    "extension": (
-                        PathUtils.get_file_extension(target)
-                        if PathUtils.path_exists(target)
-                        else None
-                    ),
+                    "exists": exists,
+                    "is_absolute": is_absolute,
+                    "is_directory": is_directory,
+                    "extension": extension,
                 },
             },
-            "Fix path issues: " + "; ".join(errors) if errors else None,
+            suggested_fix,
         )
 
 
 class ConfigurationValidationRule(ValidationRule):
     """Validation rule for configuration parameters."""
 
+    __slots__ = ("required_fields", "field_types", "field_validators")
+
     def __init__(
         self,
         required_fields: list[str],
@@ -182,20 +289,21 @@ class ConfigurationValidationRule(ValidationRule):
                 "Provide a valid configuration dictionary",
             )
 
-        errors = []
-
         # Check required fields
-        for field in self.required_fields:
-            if field not in target or target[field] is None:
-                errors.append(f"Required field '{field}' is missing or None")
+        missing_fields = [
+            field for field in self.required_fields if target.get(field) is None
+        ]
+        errors = [
+            f"Required field '{field}' is missing or None" for field in missing_fields
+        ]
 
         # Check field types
         for field, expected_type in self.field_types.items():
-            if field in target and target[field] is not None:
-                if not isinstance(target[field], expected_type):
-                    errors.append(
-                        f"Field '{field}' must be of type {expected_type.__name__}, got {type(target[field]).__name__}"
-                    )
+            value = target.get(field)
+            if value is not None and not isinstance(value, expected_type):
+                errors.append(
+                    f"Field '{field}' must be of type {expected_type.__name__}, got {type(value).__name__}"
+                )
 
         # Run custom validators
         for field, validator in self.field_validators.items():
@@ -206,12 +314,14 @@ class ConfigurationValidationRule(ValidationRule):
                 except Exception as e:
                     errors.append(f"Field '{field}' validation error: {str(e)}")
 
-        is_valid = len(errors) == 0
-        message = (
-            "Configuration validation passed"
-            if is_valid
-            else f"Configuration validation failed: {'; '.join(errors)}"
-        )
+        is_valid = not errors
+        if is_valid:
+            message = "Configuration validation passed"
+            suggested_fix = None
+        else:
+            joined = "; ".join(errors)
+            message = f"Configuration validation failed: {joined}"
+            suggested_fix = f"Fix configuration issues: {joined}"
 
         return self.create_result(
             is_valid,
@@ -220,20 +330,18 @@ class ConfigurationValidationRule(ValidationRule):
             {
                 "errors": errors,
                 "provided_fields": list(target.keys()),
-                "required_fields": self.required_fields,
-                "missing_fields": [
-                    f
-                    for f in self.required_fields
-                    if f not in target or target[f] is None
-                ],
+                "required_fields": list(self.required_fields),
+                "missing_fields": missing_fields,
             },
-            "Fix configuration issues: " + "; ".join(errors) if errors else None,
+            suggested_fix,
         )
 
 
 class OperationDataValidationRule(ValidationRule):
     """Validation rule for operation data structures."""
 
+    __slots__ = ("required_fields", "valid_statuses", "_valid_statuses_set")
+
     def __init__(self):
         super().__init__(
             "operation_data_validation", "Validate operation data structure"
@@ -245,6 +353,7 @@ class OperationDataValidationRule(ValidationRule):
             "status",
         ]
         self.valid_statuses = ["pending", "running", "completed", "failed", "cancelled"]
+        self._valid_statuses_set = frozenset(self.valid_statuses)
 
     def validate(
         self, target: OperationData, context: dict[str, Any] = None
@@ -259,17 +368,20 @@ class OperationDataValidationRule(ValidationRule):
                 "Provide a valid operation data dictionary",
             )
 
-        errors = []
-
         # Check required fields
-        for field in self.required_fields:
-            if field not in target or not target[field]:
-                errors.append(f"Required field '{field}' is missing or empty")
+        errors = [
+            f"Required field '{field}' is missing or empty"
+            for field in self.required_fields
+            if not target.get(field)
+        ]
 
         # Validate status
-        if "status" in target and target["status"] not in self.valid_statuses:
+        status = target.get("status")
+        if "status" in target and (
+            not isinstance(status, str) or status not in self._valid_statuses_set
+        ):
             errors.append(
-                f"Invalid status '{target['status']}'. Must be one of: {self.valid_statuses}"
+                f"Invalid status '{status}'. Must be one of: {self.valid_statuses}"
             )
 
         # Validate progress percent
@@ -288,17 +400,17 @@ class OperationDataValidationRule(ValidationRule):
         timestamp_fields = ["created_at", "started_at", "completed_at"]
         for field in timestamp_fields:
             if field in target and target[field]:
-                try:
-                    datetime.fromisoformat(target[field].replace("Z", "+00:00"))
-                except ValueError:
+                if not _is_iso_timestamp(target[field]):
                     errors.append(f"Field '{field}' must be a valid ISO timestamp")
 
-        is_valid = len(errors) == 0
-        message = (
-            "Operation data validation passed"
-            if is_valid
-            else f"Operation data validation failed: {'; '.join(errors)}"
-        )
+        is_valid = not errors
+        if is_valid:
+            message = "Operation data validation passed"
+            suggested_fix = None
+        else:
+            joined = "; ".join(errors)
+            message = f"Operation data validation failed: {joined}"
+            suggested_fix = f"Fix operation data issues: {joined}"
 
         return self.create_result(
             is_valid,
@@ -308,28 +420,55 @@ class OperationDataValidationRule(ValidationRule):
                 "errors": errors,
                 "operation_data": target,
                 "provided_fields": list(target.keys()),
-                "required_fields": self.required_fields,
+                "required_fields": list(self.required_fields),
             },
-            "Fix operation data issues: " + "; ".join(errors) if errors else None,
+            suggested_fix,
         )
 
 
 class RegexValidationRule(ValidationRule):
     """Validation rule using regular expressions."""
 
+    __slots__ = (
+        "pattern",
+        "pattern_str",
+        "must_match",
+        "_match_message",
+        "_mismatch_message",
+        "_suggested_fix",
+    )
+
     def __init__(
         self,
-        pattern: str,
+        pattern: str | re.Pattern[str],
         rule_id: str,
         description: str,
         case_sensitive: bool = True,
         must_match: bool = True,
     ):
         super().__init__(rule_id, description)
-        flags = 0 if case_sensitive else re.IGNORECASE
-        self.pattern = re.compile(pattern, flags)
-        self.pattern_str = pattern
+        if isinstance(pattern, re.Pattern):
+            flags = pattern.flags if case_sensitive else pattern.flags | re.IGNORECASE
+            self.pattern = (
+                pattern if flags == pattern.flags else _compile_cached(pattern.pattern, flags)
+            )
+            self.pattern_str = pattern.pattern
+        else:
+            flags = 0 if case_sensitive else re.IGNORECASE
+            self.pattern = _compile_cached(pattern, flags)
+            self.pattern_str = pattern
         self.must_match = must_match
+        # Result texts depend only on the rule, so build them once
+        self._match_message = f"String matches pattern '{self.pattern_str}'"
+        self._mismatch_message = (
+            f"String does not match required pattern '{self.pattern_str}'"
+            if must_match
+            else f"String matches forbidden pattern '{self.pattern_str}'"
+        )
+        self._suggested_fix = (
+            f"Ensure string {'matches' if must_match else 'does not match'} "
+            f"pattern '{self.pattern_str}'"
+        )
 
     def validate(self, target: str, context: dict[str, Any] = None) -> ValidationResult:
         """Validate string against regex pattern."""
@@ -345,27 +484,52 @@ class RegexValidationRule(ValidationRule):
         matches = bool(self.pattern.search(target))
         is_valid = matches if self.must_match else not matches
 
-        if is_valid:
-            message = f"String matches pattern '{self.pattern_str}'"
-        else:
-            if self.must_match:
-                message = f"String does not match required pattern '{self.pattern_str}'"
-            else:
-                message = f"String matches forbidden pattern '{self.pattern_str}'"
-
         return self.create_result(
             is_valid,
-            message,
+            self._match_message if is_valid else self._mismatch_message,
             target,
             {
                 "pattern": self.pattern_str,
                 "matches": matches,
                 "must_match": self.must_match,
             },
-            f"Ensure string {'matches' if self.must_match else 'does not match'} pattern '{self.pattern_str}'",
+            self._suggested_fix,
         )
 
 
+# Rules are not modified after construction, so the convenience methods
+# reuse one instance per distinct set of arguments.
+
+
+@lru_cache(maxsize=128)
+def _get_path_rule(
+    must_exist: bool,
+    must_be_absolute: bool,
+    must_be_directory: bool,
+    must_be_file: bool,
+    allowed_extensions: tuple[str, ...],
+) -> PathValidationRule:
+    return PathValidationRule(
+        must_exist=must_exist,
+        must_be_absolute=must_be_absolute,
+        must_be_directory=must_be_directory,
+        must_be_file=must_be_file,
+        allowed_extensions=list(allowed_extensions),
+    )
+
+
+@lru_cache(maxsize=128)
+def _get_config_rule(required_fields: tuple[str, ...]) -> ConfigurationValidationRule:
+    return ConfigurationValidationRule(required_fields=list(required_fields))
+
+
+@lru_cache(maxsize=128)
+def _get_regex_rule(pattern: str, must_match: bool) -> RegexValidationRule:
+    return RegexValidationRule(
+        pattern, "custom_regex", "Custom regex validation", must_match=must_match
+    )
+
+
 class ValidationEngine:
     """Central validation engine that manages and executes validation rules."""
 
@@ -404,13 +568,13 @@ class ValidationEngine:
         # Common regex patterns
         self.register_rule(
             RegexValidationRule(
-                r"^[a-zA-Z0-9_-]+$", "alphanumeric_id", "Alphanumeric ID validation"
+                _ALNUM_ID_RE, "alphanumeric_id", "Alphanumeric ID validation"
             ),
             "alphanumeric_id",
         )
         self.register_rule(
             RegexValidationRule(
-                r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
+                _EMAIL_RE,
                 "email",
                 "Email validation",
             ),
@@ -418,7 +582,7 @@ class ValidationEngine:
         )
         self.register_rule(
             RegexValidationRule(
-                r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}",
+                _ISO_TS_RE,
                 "iso_timestamp",
                 "ISO timestamp validation",
             ),
@@ -450,11 +614,17 @@ class ValidationEngine:
         """Create a group of validation rules."""
         self.rule_groups[group_name] = rule_names
 
+    @staticmethod
+    def _with_path_info_cache(context: dict[str, Any] = None) -> dict[str, Any]:
+        """Copy context with a fresh path lookup cache for one validation run."""
+        return {**(context or {}), PATH_INFO_CACHE_KEY: {}}
+
     def validate_single(
         self, rule_name: str, target: Any, context: dict[str, Any] = None
     ) -> ValidationResult:
         """Validate target against a single rule."""
-        if rule_name not in self.rules:
+        rule = self.rules.get(rule_name)
+        if rule is None:
             return ValidationResult(
                 is_valid=False,
                 message=f"Unknown validation rule: {rule_name}",
@@ -463,16 +633,23 @@ class ValidationEngine:
                 severity="error",
                 details={"rule_name": rule_name},
                 suggested_fix=f"Use a valid rule name. Available: {list(self.rules.keys())}",
-                validation_timestamp=datetime.now().isoformat(),
+                validation_timestamp=_validation_timestamp(),
             )
 
-        rule = self.rules[rule_name]
         return rule.validate(target, context)
 
     def validate_group(
-        self, group_name: str, target: Any, context: dict[str, Any] = None
+        self,
+        group_name: str,
+        target: Any,
+        context: dict[str, Any] = None,
+        fast_fail: bool = False,
     ) -> list[ValidationResult]:
-        """Validate target against a group of rules."""
+        """Validate target against a group of rules.
+
+        With fast_fail, stops after the first failed rule of "error" severity,
+        so the returned list may be shorter than the group.
+        """
         if group_name not in self.rule_groups:
             return [
                 ValidationResult(
@@ -483,28 +660,84 @@ class ValidationEngine:
                     severity="error",
                     details={"group_name": group_name},
                     suggested_fix=f"Use a valid group name. Available: {list(self.rule_groups.keys())}",
-                    validation_timestamp=datetime.now().isoformat(),
+                    validation_timestamp=_validation_timestamp(),
                 )
             ]
 
-        results = []
-        for rule_name in self.rule_groups[group_name]:
-            result = self.validate_single(rule_name, target, context)
-            results.append(result)
-
-        return results
+        return self.validate_multiple(
+            self.rule_groups[group_name], target, context, fast_fail
+        )
 
     def validate_multiple(
-        self, rule_names: list[str], target: Any, context: dict[str, Any] = None
+        self,
+        rule_names: list[str],
+        target: Any,
+        context: dict[str, Any] = None,
+        fast_fail: bool = False,
     ) -> list[ValidationResult]:
-        """Validate target against multiple rules."""
+        """Validate target against multiple rules.
+
+        With fast_fail, stops after the first failed rule of "error" severity.
+        """
+        context = self._with_path_info_cache(context)
         results = []
-        for rule_name in rule_names:
-            result = self.validate_single(rule_name, target, context)
-            results.append(result)
+        with _batch_timestamp_scope():
+            for rule_name in rule_names:
+                result = self.validate_single(rule_name, target, context)
+                results.append(result)
+                if fast_fail and _is_fatal(result):
+                    break
 
         return results
 
+    @staticmethod
+    def _scan_path_info(paths: list[str]) -> dict[str, tuple]:
+        """Pre-compute path info for paths sharing a parent with one scandir.
+
+        Entries that cannot be resolved from the listing (symlinks, names the
+        listing does not contain, unreadable parents) are left out and fall
+        back to per-path lookups, since a missing name may still exist on a
+        case-insensitive filesystem (FAT/exFAT SD cards, default APFS).
+        """
+        by_parent: dict[str, dict[str, str]] = {}
+        for path in paths:
+            parent, name = os.path.split(path)
+            if name and name not in (".", ".."):
+                by_parent.setdefault(parent, {})[name] = path
+
+        info: dict[str, tuple] = {}
+        for parent, names in by_parent.items():
+            if len(names) < 2:
+                continue
+            try:
+                with os.scandir(parent or ".") as entries:
+                    for entry in entries:
+                        path = names.pop(entry.name, None)
+                        if path is None or entry.is_symlink():
+                            continue
+                        info[path] = (
+                            True,
+                            PathUtils.is_absolute_path(path),
+                            entry.is_dir(),
+                            os.path.splitext(path)[1],
+                        )
+            except OSError:
+                continue
+        return info
+
+    def validate_paths_bulk(
+        self, paths: list[str], rule_name: str, context: dict[str, Any] = None
+    ) -> list[ValidationResult]:
+        """Validate many paths against one rule.
+
+        Paths are grouped by parent directory and each directory is listed
+        once, so existence and type checks do not stat every path separately.
+        """
+        context = self._with_path_info_cache(context)
+        context[PATH_INFO_CACHE_KEY].update(self._scan_path_info(paths))
+        with _batch_timestamp_scope():
+            return [self.validate_single(rule_name, path, context) for path in paths]
+
     def validate_path(
         self,
         path: str,
@@ -515,12 +748,12 @@ class ValidationEngine:
         allowed_extensions: list[str] = None,
     ) -> ValidationResult:
         """Convenience method for path validation."""
-        rule = PathValidationRule(
-            must_exist=must_exist,
-            must_be_absolute=must_be_absolute,
-            must_be_directory=must_be_directory,
-            must_be_file=must_be_file,
-            allowed_extensions=allowed_extensions,
+        rule = _get_path_rule(
+            must_exist,
+            must_be_absolute,
+            must_be_directory,
+            must_be_file,
+            tuple(allowed_extensions) if allowed_extensions else (),
         )
         return rule.validate(path)
 
@@ -532,11 +765,15 @@ class ValidationEngine:
         field_validators: dict[str, Callable] = None,
     ) -> ValidationResult:
         """Convenience method for configuration validation."""
-        rule = ConfigurationValidationRule(
-            required_fields=required_fields,
-            field_types=field_types,
-            field_validators=field_validators,
-        )
+        if field_types or field_validators:
+            # Type maps and callables are not hashable cache keys
+            rule = ConfigurationValidationRule(
+                required_fields=required_fields,
+                field_types=field_types,
+                field_validators=field_validators,
+            )
+        else:
+            rule = _get_config_rule(tuple(required_fields))
         return rule.validate(config)
 
     def validate_operation_data(
@@ -549,31 +786,48 @@ class ValidationEngine:
         self, text: str, pattern: str, must_match: bool = True
     ) -> ValidationResult:
         """Convenience method for regex validation."""
-        rule = RegexValidationRule(
-            pattern, "custom_regex", "Custom regex validation", must_match=must_match
-        )
-        return rule.validate(text)
+        return _get_regex_rule(pattern, must_match).validate(text)
+
+    def validate_alphanumeric_ids_bulk(self, ids: list[str]) -> list[bool]:
+        """Check many IDs against the alphanumeric_id rule's character set.
+
+        Returns one flag per ID instead of a full result, for bulk checks
+        such as manifest loading where only the pass/fail mask is needed.
+        """
+        return [_is_alphanumeric_id(value) for value in ids]
 
     def get_validation_summary(self, results: list[ValidationResult]) -> dict[str, Any]:
         """Get summary of validation results."""
         total = len(results)
-        passed = sum(1 for r in results if r.is_valid)
-        failed = total - passed
-
-        errors = [r for r in results if not r.is_valid and r.severity == "error"]
-        warnings = [r for r in results if not r.is_valid and r.severity == "warning"]
+        error_count = 0
+        warning_count = 0
+        failed_rules = []
+
+        # One pass over the results; only failures need further inspection
+        for r in results:
+            if r["is_valid"]:
+                continue
+            failed_rules.append(r["rule_id"])
+            severity = r["severity"]
+            if severity == "error":
+                error_count += 1
+            elif severity == "warning":
+                warning_count += 1
+
+        failed = len(failed_rules)
+        passed = total - failed
 
         return {
             "total_validations": total,
             "passed": passed,
             "failed": failed,
             "success_rate": (passed / total * 100) if total > 0 else 0,
-            "error_count": len(errors),
-            "warning_count": len(warnings),
+            "error_count": error_count,
+            "warning_count": warning_count,
             "all_passed": failed == 0,
-            "has_errors": len(errors) > 0,
-            "has_warnings": len(warnings) > 0,
-            "failed_rules": [r.rule_id for r in results if not r.is_valid],
+            "has_errors": error_count > 0,
+            "has_warnings": warning_count > 0,
+            "failed_rules": failed_rules,
         }
 
     def get_available_rules(self) -> dict[str, str]:
@@ -616,13 +870,25 @@ def validate_regex(
     return validation_engine.validate_regex(text, pattern, must_match)
 
 
+def validate_alphanumeric_ids_bulk(ids: list[str]) -> list[bool]:
+    """Check which IDs consist only of letters, digits, '_' and '-'."""
+    return validation_engine.validate_alphanumeric_ids_bulk(ids)
+
+
 def validate_multiple(
-    targets: list[tuple], rule_names: list[str]
+    targets: list[tuple], rule_names: list[str], fast_fail: bool = False
 ) -> list[ValidationResult]:
-    """Validate multiple targets against specified rules."""
+    """Validate multiple targets against specified rules.
+
+    With fast_fail, the remaining rules of a target are skipped after its
+    first failed rule of "error" severity; other targets are still checked.
+    """
     results = []
-    for target, context in targets:
-        for rule_name in rule_names:
-            result = validation_engine.validate_single(rule_name, target, context)
-            results.append(result)
+    with _batch_timestamp_scope():
+        for target, context in targets:
+            for rule_name in rule_names:
+                result = validation_engine.validate_single(rule_name, target, context)
+                results.append(result)
+                if fast_fail and _is_fatal(result):
+                    break
     return results
\ No newline at end of file
@@ -4,8 +4,10 @@ Script de teste para verificar as correções de privilégios administrativos
 e localização do sistema Windows.
 """
 
+import argparse
 import sys
 import os
+import locale
 from pathlib import Path
 
 # Add src directory to Python path
@@ -13,6 +15,9 @@ src_path = Path(__file__).parent / "src"
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
+# Idioma do sistema lido uma única vez (getdefaultlocale está obsoleto)
+SYSTEM_LANG = locale.getlocale()[0]
+
 def test_admin_utils():
     """Testa o módulo admin_utils."""
     print("🔍 Testando AdminUtils...")
@@ -29,9 +34,7 @@ def test_admin_utils():
         print(f"✅ Nome da conta localizada: '{everyone_account}'")
         
         # Test system language detection
-        import locale
-        system_lang = locale.getdefaultlocale()[0]
-        print(f"✅ Idioma do sistema detectado: {system_lang}")
+        print(f"✅ Idioma do sistema detectado: {SYSTEM_LANG}")
         
         return True
         
@@ -44,13 +47,12 @@ def test_migration_service_fixes():
     print("🔍 Testando correções no MigrationService...")
     
     try:
-        from sd_emulation_gui.app.container import ApplicationContainer
-        from sd_emulation_gui.services.migration_service import MigrationStep, MigrationPlan
-        
-        # Initialize container
-        container = ApplicationContainer()
-        container.wire()
-        migration_service = container.migration_service()
+        # Só os tipos de passo/plano são testados; o container não é necessário
+        from sd_emulation_gui.services.migration_service import (
+            ADMIN_ACTIONS,
+            MigrationPlan,
+            MigrationStep,
+        )
         
         # Test creating migration steps with different path types
         print("✅ Testando criação de passos com diferentes tipos de Path...")
@@ -83,7 +85,7 @@ def test_migration_service_fixes():
         print(f"✅ Plano criado com {plan.total_steps} passos")
         
         # Test admin privilege requirements detection
-        requires_admin = any(step.action in ["create_symlink", "move_file"] for step in plan.steps)
+        requires_admin = any(step.action in ADMIN_ACTIONS for step in plan.steps)
         print(f"✅ Plano requer privilégios admin: {requires_admin}")
         
         return True
@@ -116,9 +118,11 @@ def test_localized_permissions():
             print(f"✅ Comando icacls: {' '.join(cmd)}")
             
             try:
+                # Apenas stderr é inspecionado; a saída do /T é descartada
                 result = subprocess.run(
                     cmd,
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     text=True,
                     check=False,
                     timeout=10
@@ -146,15 +150,27 @@ def test_localized_permissions():
         print(f"❌ Erro ao testar icacls: {e}")
         return False
 
-def main():
-    """Executa todos os testes."""
+TESTS = {
+    "admin": ("AdminUtils", test_admin_utils),
+    "migration": ("MigrationService Fixes", test_migration_service_fixes),
+    "permissions": ("Localized Permissions", test_localized_permissions),
+}
+
+
+def main(argv=None):
+    """Executa os testes selecionados (todos por padrão)."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--test",
+        choices=[*TESTS, "all"],
+        default="all",
+        help="Executa apenas o teste indicado",
+    )
+    args = parser.parse_args(argv)
+
     print("🚀 Iniciando testes das correções de privilégios administrativos...\n")
     
-    tests = [
-        ("AdminUtils", test_admin_utils),
-        ("MigrationService Fixes", test_migration_service_fixes),
-        ("Localized Permissions", test_localized_permissions),
-    ]
+    tests = list(TESTS.values()) if args.test == "all" else [TESTS[args.test]]
     
     results = []
     for test_name, test_func in tests:
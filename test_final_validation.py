@@ -6,6 +6,7 @@ Executa uma validação completa de todas as funcionalidades implementadas
 no FrontEmu-Tools v1.0, incluindo serviços, interface gráfica e integração.
 """
 
+import logging
 import sys
 import unittest
 import time
@@ -22,12 +23,24 @@ try:
     from PySide6.QtWidgets import QApplication
     from PySide6.QtCore import Qt
 except ImportError:
+    if "pytest" in sys.modules:
+        # Sob o pytest, pula só este módulo em vez de encerrar o processo
+        import pytest
+        pytest.skip("PySide6 não está disponível", allow_module_level=True)
     print("❌ PySide6 não está disponível para testes")
     sys.exit(1)
 
-from sd_emulation_gui.infrastructure.dependency_container import configure_container
+from sd_emulation_gui.infrastructure.dependency_container import (
+    DependencyContainer,
+    configure_container,
+)
 from sd_emulation_gui.gui.main_window import MainWindow
 from sd_emulation_gui.domain.entities import SystemPlatform
+from tests.helpers import ESSENTIAL_SERVICES
+
+
+# Mensagens de progresso dos testes; visíveis com log_cli_level=DEBUG
+log = logging.getLogger(__name__)
 
 
 class TestFinalValidation(unittest.TestCase):
@@ -36,120 +49,123 @@ class TestFinalValidation(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Configuração inicial dos testes."""
-        print("🔧 Configurando ambiente de teste...")
+        log.debug("🔧 Configurando ambiente de teste...")
         
-        # Verificar se já existe uma instância do QApplication
-        if QApplication.instance() is None:
-            cls.app = QApplication([])
-        else:
-            cls.app = QApplication.instance()
+        # Reutilizar o QApplication existente (ex.: fixture do pytest)
+        cls.app = QApplication.instance() or QApplication([])
         
         # Configurar container de dependências
         cls.container = configure_container({})
-        print("✅ Ambiente configurado com sucesso!")
+        
+        # Janela compartilhada pelos testes; cada teste restaura o estado inicial
+        cls.main_window = MainWindow(cls.container, skip_visual=True)
+        cls.default_title = cls.main_window.windowTitle()
+        cls.default_minimum_size = cls.main_window.minimumSize()
+        log.debug("✅ Ambiente configurado com sucesso!")
     
     @classmethod
     def tearDownClass(cls):
         """Limpeza após os testes."""
-        print("🧹 Limpando ambiente de teste...")
+        log.debug("🧹 Limpando ambiente de teste...")
+        cls.main_window.deleteLater()
+    
+    def setUp(self):
+        """Restaura a janela compartilhada antes de cada teste."""
+        self.main_window.hide()
+        self.main_window.setWindowTitle(self.default_title)
+        self.main_window.setMinimumSize(self.default_minimum_size)
+        self.main_window.resize(self.default_minimum_size)
     
     def test_01_dependency_container_validation(self):
         """Valida se o container de dependências está funcionando corretamente."""
-        print("\n📦 Testando Container de Dependências...")
+        log.debug("📦 Testando Container de Dependências...")
         
         # Verificar se o container foi criado
         self.assertIsNotNone(self.container, "Container deve ser criado")
         
         # Verificar serviços essenciais
-        essential_services = [
-            ("SystemInfoService", self.container.get_system_info_service),
-            ("DriveDetectionService", self.container.get_drive_detection_service),
-            ("ConfigurationService", self.container.get_configuration_service),
-            ("SystemStatsService", self.container.get_system_stats_service)
-        ]
-        
-        for service_name, service_getter in essential_services:
-            service = service_getter()
-            self.assertIsNotNone(service, f"{service_name} deve estar disponível")
-            print(f"  ✅ {service_name}: OK")
-        
-        print("📦 Container de Dependências: VALIDADO")
+        for name in ESSENTIAL_SERVICES:
+            service = getattr(self.container, f"get_{name}")()
+            self.assertIsNotNone(service, f"{name} deve estar disponível")
+            log.debug(f"  ✅ {name}: OK")
+        
+        log.debug("📦 Container de Dependências: VALIDADO")
     
     def test_02_domain_entities_validation(self):
         """Valida se as entidades de domínio estão funcionando."""
-        print("\n🏗️ Testando Entidades de Domínio...")
+        log.debug("🏗️ Testando Entidades de Domínio...")
         
         # Testar enum SystemPlatform
-        self.assertTrue(hasattr(SystemPlatform, 'PC_WINDOWS'), "PC_WINDOWS deve existir")
-        self.assertTrue(hasattr(SystemPlatform, 'PC_LINUX'), "PC_LINUX deve existir")
-        self.assertTrue(hasattr(SystemPlatform, 'PC_MACOS'), "PC_MACOS deve existir")
-        self.assertTrue(hasattr(SystemPlatform, 'NINTENDO_SWITCH'), "NINTENDO_SWITCH deve existir")
+        expected = {"PC_WINDOWS", "PC_LINUX", "PC_MACOS", "NINTENDO_SWITCH"}
+        missing = expected - SystemPlatform.__members__.keys()
+        self.assertFalse(missing, f"Plataformas ausentes: {sorted(missing)}")
         
-        print("  ✅ SystemPlatform: Todas as plataformas disponíveis")
-        print("🏗️ Entidades de Domínio: VALIDADAS")
+        log.debug("  ✅ SystemPlatform: Todas as plataformas disponíveis")
+        log.debug("🏗️ Entidades de Domínio: VALIDADAS")
     
     def test_03_services_functionality_validation(self):
         """Valida a funcionalidade dos serviços principais."""
-        print("\n⚙️ Testando Funcionalidade dos Serviços...")
+        log.debug("⚙️ Testando Funcionalidade dos Serviços...")
         
         # Testar SystemInfoService
         system_info_service = self.container.get_system_info_service()
         system_info = system_info_service.get_system_info()
         self.assertIsInstance(system_info, dict, "SystemInfo deve retornar dicionário")
         self.assertIn('platform', system_info, "SystemInfo deve conter 'platform'")
-        print("  ✅ SystemInfoService: Funcional")
+        log.debug("  ✅ SystemInfoService: Funcional")
         
         # Testar DriveDetectionService
         drive_service = self.container.get_drive_detection_service()
         drives = drive_service.get_all_drives()
         self.assertIsInstance(drives, dict, "Drives deve retornar dicionário")
-        print("  ✅ DriveDetectionService: Funcional")
+        log.debug("  ✅ DriveDetectionService: Funcional")
         
         # Testar ConfigurationService
         config_service = self.container.get_configuration_service()
         self.assertIsNotNone(config_service, "ConfigurationService deve estar disponível")
-        print("  ✅ ConfigurationService: Funcional")
+        log.debug("  ✅ ConfigurationService: Funcional")
         
         # Testar SystemStatsService
         stats_service = self.container.get_system_stats_service()
         self.assertIsNotNone(stats_service, "SystemStatsService deve estar disponível")
-        print("  ✅ SystemStatsService: Funcional")
+        log.debug("  ✅ SystemStatsService: Funcional")
         
-        print("⚙️ Serviços: VALIDADOS")
+        log.debug("⚙️ Serviços: VALIDADOS")
     
     def test_04_gui_integration_validation(self):
         """Valida a integração da interface gráfica."""
-        print("\n🖥️ Testando Integração da Interface Gráfica...")
+        log.debug("🖥️ Testando Integração da Interface Gráfica...")
         
-        # Criar MainWindow
-        main_window = MainWindow(self.container)
+        # MainWindow criada em setUpClass
+        main_window = self.main_window
         self.assertIsNotNone(main_window, "MainWindow deve ser criada")
-        print("  ✅ MainWindow: Criada com sucesso")
+        log.debug("  ✅ MainWindow: Criada com sucesso")
         
         # Verificar propriedades básicas
         self.assertTrue(len(main_window.windowTitle()) > 0, "Janela deve ter título")
-        print("  ✅ Título da janela: Configurado")
+        log.debug("  ✅ Título da janela: Configurado")
         
         # Verificar tamanho mínimo
         min_size = main_window.minimumSize()
         self.assertGreater(min_size.width(), 0, "Largura mínima deve ser > 0")
         self.assertGreater(min_size.height(), 0, "Altura mínima deve ser > 0")
-        print("  ✅ Tamanho mínimo: Configurado")
+        log.debug("  ✅ Tamanho mínimo: Configurado")
         
         # Verificar widgets filhos
-        children = main_window.findChildren(object)
-        self.assertGreater(len(children), 0, "MainWindow deve ter widgets filhos")
-        print(f"  ✅ Widgets integrados: {len(children)} widgets encontrados")
+        # Filhos diretos bastam: não percorre a árvore inteira de objetos
+        children = main_window.children()
+        self.assertTrue(children, "MainWindow deve ter widgets filhos")
+        log.debug(f"  ✅ Widgets integrados: {len(children)} filhos diretos encontrados")
         
-        print("🖥️ Interface Gráfica: VALIDADA")
+        log.debug("🖥️ Interface Gráfica: VALIDADA")
     
     def test_05_application_startup_validation(self):
         """Valida se a aplicação pode ser iniciada corretamente."""
-        print("\n🚀 Testando Inicialização da Aplicação...")
+        log.debug("🚀 Testando Inicialização da Aplicação...")
         
         try:
             # Simular inicialização da aplicação
-            main_window = MainWindow(self.container)
+            main_window = self.main_window
             main_window.setWindowTitle("FrontEmu-Tools v1.0.0 - Teste")
             main_window.setMinimumSize(1200, 800)
             
@@ -164,42 +180,47 @@ class TestFinalValidation(unittest.TestCase):
             main_window.hide()
             self.assertFalse(main_window.isVisible(), "Janela deve estar oculta após hide()")
             
-            print("  ✅ Ciclo de vida da janela: Funcional")
-            print("  ✅ Inicialização: Bem-sucedida")
+            log.debug("  ✅ Ciclo de vida da janela: Funcional")
+            log.debug("  ✅ Inicialização: Bem-sucedida")
             
         except Exception as e:
             self.fail(f"Erro na inicialização da aplicação: {e}")
         
-        print("🚀 Inicialização da Aplicação: VALIDADA")
+        log.debug("🚀 Inicialização da Aplicação: VALIDADA")
     
     def test_06_performance_validation(self):
         """Valida a performance básica do sistema."""
-        print("\n⚡ Testando Performance do Sistema...")
+        log.debug("⚡ Testando Performance do Sistema...")
         
-        # Testar tempo de criação do container
-        start_time = time.time()
-        test_container = configure_container({})
-        container_time = time.time() - start_time
+        # Testar tempo de criação do container (instância própria, para não
+        # finalizar o container global compartilhado pelos demais testes)
+        # perf_counter_ns: monotônico e com resolução bem menor que os ~15 ms
+        # do time.time() no Windows
+        start_ns = time.perf_counter_ns()
+        test_container = DependencyContainer({})
+        container_time = (time.perf_counter_ns() - start_ns) / 1e9
         
-        self.assertLess(container_time, 5.0, "Container deve ser criado em menos de 5 segundos")
-        print(f"  ✅ Criação do container: {container_time:.2f}s")
+        # Serviços legados são criados sob demanda, então a construção é rápida
+        self.assertLess(container_time, 1.0, "Container deve ser criado em menos de 1 segundo")
+        log.debug(f"  ✅ Criação do container: {container_time:.2f}s")
         
         # Testar tempo de criação da GUI
-        start_time = time.time()
-        test_window = MainWindow(test_container)
-        gui_time = time.time() - start_time
+        start_ns = time.perf_counter_ns()
+        test_window = MainWindow(test_container, skip_visual=True)
+        gui_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         self.assertLess(gui_time, 10.0, "GUI deve ser criada em menos de 10 segundos")
-        print(f"  ✅ Criação da GUI: {gui_time:.2f}s")
+        log.debug(f"  ✅ Criação da GUI: {gui_time:.2f}s")
+        test_window.deleteLater()
         
-        print("⚡ Performance: VALIDADA")
+        log.debug("⚡ Performance: VALIDADA")
     
     def test_07_integration_validation(self):
         """Valida a integração completa do sistema."""
-        print("\n🔗 Testando Integração Completa...")
+        log.debug("🔗 Testando Integração Completa...")
         
         # Verificar se todos os componentes trabalham juntos
-        main_window = MainWindow(self.container)
+        self.assertIsNotNone(self.main_window, "MainWindow deve estar disponível")
         
         # Verificar se os serviços estão acessíveis através da GUI
         system_info_service = self.container.get_system_info_service()
@@ -216,7 +237,7 @@ class TestFinalValidation(unittest.TestCase):
         ])
         
         self.assertTrue(services_working, "Todos os serviços devem estar funcionando")
-        print("  ✅ Integração de serviços: Funcional")
+        log.debug("  ✅ Integração de serviços: Funcional")
         
         # Verificar se a GUI pode acessar os serviços
         try:
@@ -224,11 +245,21 @@ class TestFinalValidation(unittest.TestCase):
             drives = drive_service.get_all_drives()
             self.assertIsInstance(system_info, dict, "SystemInfo deve retornar dados")
             self.assertIsInstance(drives, dict, "Drives deve retornar dados")
-            print("  ✅ Acesso aos dados: Funcional")
+            log.debug("  ✅ Acesso aos dados: Funcional")
         except Exception as e:
             self.fail(f"Erro ao acessar dados dos serviços: {e}")
         
-        print("🔗 Integração Completa: VALIDADA")
+        log.debug("🔗 Integração Completa: VALIDADA")
+
+
+class _NullStream:
+    """Saída descartada do runner silencioso, sem abrir arquivos."""
+    
+    def write(self, _text):
+        pass
+    
+    def flush(self):
+        pass
 
 
 def main():
@@ -241,13 +272,14 @@ def main():
     
     # Executar testes
     suite = unittest.TestLoader().loadTestsFromTestCase(TestFinalValidation)
-    runner = unittest.TextTestRunner(verbosity=0, stream=open(os.devnull, 'w'))
+    runner = unittest.TextTestRunner(verbosity=0, stream=_NullStream())
     result = runner.run(suite)
+    success = result.wasSuccessful()
     
     print()
     print("=" * 70)
     
-    if result.wasSuccessful():
+    if success:
         print("🎉 VALIDAÇÃO FINAL: SUCESSO!")
         print("✅ Todas as funcionalidades estão operacionais")
         print("✅ FrontEmu-Tools v1.0.0 está pronto para uso")
@@ -264,6 +296,8 @@ def main():
         print("🚀 O FrontEmu-Tools está pronto para produção!")
     else:
         print("❌ VALIDAÇÃO FINAL: FALHOU!")
+    
+    if not success:
         print(f"❌ {len(result.failures)} teste(s) falharam")
         print(f"❌ {len(result.errors)} erro(s) encontrado(s)")
         
@@ -278,7 +312,7 @@ def main():
                 print(f"  • {test}: {traceback}")
     
     print("=" * 70)
-    return 0 if result.wasSuccessful() else 1
+    return 0 if success else 1
 
 
 if __name__ == "__main__":
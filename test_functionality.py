@@ -4,6 +4,7 @@ Teste de funcionalidade do FrontEmu-Tools
 Valida os componentes principais do sistema
 """
 
+import logging
 import sys
 import os
 import unittest
@@ -28,21 +29,31 @@ try:
     from sd_emulation_gui.gui.widgets.system_stats_widget import SystemStatsWidget
     print("✅ Todas as importações foram bem-sucedidas!")
 except ImportError as e:
+    if "pytest" in sys.modules:
+        # Sob o pytest, pula só este módulo em vez de encerrar o processo
+        import pytest
+        pytest.skip(f"Dependência indisponível: {e}", allow_module_level=True)
     print(f"❌ Erro de importação: {e}")
     sys.exit(1)
 
 
+# Mensagens de progresso dos testes; visíveis com log_cli_level=DEBUG
+log = logging.getLogger(__name__)
+
+
 class TestFrontEmuTools(unittest.TestCase):
     """Testes de funcionalidade do FrontEmu-Tools"""
     
-    def setUp(self):
-        """Configuração inicial para cada teste"""
-        self.container = configure_container({})
+    @classmethod
+    def setUpClass(cls):
+        """Configuração inicial, compartilhada por todos os testes da classe"""
+        # Os testes apenas leem o container; construí-lo uma vez basta
+        cls.container = configure_container({})
     
     def test_dependency_container(self):
         """Testa se o container de dependências está funcionando"""
         self.assertIsNotNone(self.container)
-        print("✅ Container de dependências: OK")
+        log.debug("✅ Container de dependências: OK")
     
     def test_system_info_service(self):
         """Testa o serviço de informações do sistema"""
@@ -53,7 +64,7 @@ class TestFrontEmuTools(unittest.TestCase):
         system_info = service.get_system_info()
         self.assertIsNotNone(system_info)
         # SystemInfo não existe, mas o serviço deve retornar algo válido
-        print("✅ SystemInfoService: OK")
+        log.debug("✅ SystemInfoService: OK")
     
     def test_drive_detection_service(self):
         """Testa o serviço de detecção de drives"""
@@ -63,19 +74,19 @@ class TestFrontEmuTools(unittest.TestCase):
         # Testar detecção de drives
         drives = service.get_all_drives()
         self.assertIsInstance(drives, dict, "Drives deve ser um dicionário")
-        print("✅ DriveDetectionService: OK")
+        log.debug("✅ DriveDetectionService: OK")
     
     def test_configuration_service(self):
         """Testa o serviço de configuração"""
         service = self.container.get_configuration_service()
         self.assertIsNotNone(service)
-        print("✅ ConfigurationService: OK")
+        log.debug("✅ ConfigurationService: OK")
     
     def test_system_stats_service(self):
         """Testa o serviço de estatísticas do sistema"""
         service = self.container.get_system_stats_service()
         self.assertIsNotNone(service)
-        print("✅ SystemStatsService: OK")
+        log.debug("✅ SystemStatsService: OK")
     
     def test_widgets_import(self):
         """Testa se os widgets podem ser importados"""
@@ -84,14 +95,13 @@ class TestFrontEmuTools(unittest.TestCase):
         self.assertTrue(hasattr(SystemInfoWidget, '__init__'))
         self.assertTrue(hasattr(LegacyDetectionWidget, '__init__'))
         self.assertTrue(hasattr(SystemStatsWidget, '__init__'))
-        print("✅ Widgets: OK")
+        log.debug("✅ Widgets: OK")
     
     def test_system_platform_enum(self):
         """Testa se o enum SystemPlatform está funcionando"""
-        self.assertTrue(hasattr(SystemPlatform, 'PC_WINDOWS'))
-        self.assertTrue(hasattr(SystemPlatform, 'PC_LINUX'))
-        self.assertTrue(hasattr(SystemPlatform, 'PC_MACOS'))
-        print("✅ SystemPlatform enum: OK")
+        missing = {"PC_WINDOWS", "PC_LINUX", "PC_MACOS"} - SystemPlatform.__members__.keys()
+        self.assertFalse(missing, f"Plataformas ausentes: {sorted(missing)}")
+        log.debug("✅ SystemPlatform enum: OK")
 
 
 def main():
@@ -6,6 +6,7 @@ Testa se a interface gráfica do FrontEmu-Tools pode ser inicializada
 corretamente com todos os widgets e serviços funcionando.
 """
 
+import logging
 import sys
 import unittest
 from pathlib import Path
@@ -22,11 +23,20 @@ try:
     from PySide6.QtTest import QTest
     from PySide6.QtCore import Qt
 except ImportError:
+    if "pytest" in sys.modules:
+        # Sob o pytest, pula só este módulo em vez de encerrar o processo
+        import pytest
+        pytest.skip("PySide6 não está disponível", allow_module_level=True)
     print("❌ PySide6 não está disponível para testes")
     sys.exit(1)
 
 from sd_emulation_gui.infrastructure.dependency_container import configure_container
 from sd_emulation_gui.gui.main_window import MainWindow
+from tests.helpers import ESSENTIAL_SERVICES
+
+
+# Mensagens de progresso dos testes; visíveis com log_cli_level=DEBUG
+log = logging.getLogger(__name__)
 
 
 class TestGUIIntegration(unittest.TestCase):
@@ -35,31 +45,38 @@ class TestGUIIntegration(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Configuração inicial dos testes."""
-        # Verificar se já existe uma instância do QApplication
-        if QApplication.instance() is None:
-            cls.app = QApplication([])
-        else:
-            cls.app = QApplication.instance()
+        # Reutilizar o QApplication existente (ex.: fixture do pytest)
+        cls.app = QApplication.instance() or QApplication([])
         cls.container = configure_container({})
+        
+        # Janela compartilhada pelos testes; cada teste restaura o estado inicial
+        cls.main_window = MainWindow(cls.container, skip_visual=True)
+        cls.default_size = cls.main_window.size()
     
     @classmethod
     def tearDownClass(cls):
         """Limpeza após os testes."""
+        cls.main_window.deleteLater()
         cls.app.quit()
     
+    def setUp(self):
+        """Restaura a janela compartilhada antes de cada teste."""
+        self.main_window.hide()
+        self.main_window.resize(self.default_size)
+    
     def test_main_window_creation(self):
         """Testa se a janela principal pode ser criada."""
         try:
-            main_window = MainWindow(self.container)
+            main_window = self.main_window
             self.assertIsNotNone(main_window, "MainWindow deve ser criada")
-            print("✅ MainWindow criada com sucesso")
+            log.debug("✅ MainWindow criada com sucesso")
         except Exception as e:
             self.fail(f"Erro ao criar MainWindow: {e}")
     
     def test_main_window_initialization(self):
         """Testa se a janela principal é inicializada corretamente."""
         try:
-            main_window = MainWindow(self.container)
+            main_window = self.main_window
             
             # Verificar se a janela tem título
             self.assertTrue(len(main_window.windowTitle()) > 0, "Janela deve ter título")
@@ -69,48 +86,42 @@ class TestGUIIntegration(unittest.TestCase):
             self.assertGreater(min_size.width(), 0, "Largura mínima deve ser > 0")
             self.assertGreater(min_size.height(), 0, "Altura mínima deve ser > 0")
             
-            print("✅ MainWindow inicializada corretamente")
+            log.debug("✅ MainWindow inicializada corretamente")
         except Exception as e:
             self.fail(f"Erro na inicialização da MainWindow: {e}")
     
     def test_widgets_integration(self):
         """Testa se os widgets estão integrados corretamente."""
         try:
-            main_window = MainWindow(self.container)
+            main_window = self.main_window
             
             # Verificar se a janela tem widgets filhos
-            children = main_window.findChildren(object)
-            self.assertGreater(len(children), 0, "MainWindow deve ter widgets filhos")
+            # Filhos diretos bastam: não percorre a árvore inteira de objetos
+            children = main_window.children()
+            self.assertTrue(children, "MainWindow deve ter widgets filhos")
             
-            print(f"✅ MainWindow tem {len(children)} widgets integrados")
+            log.debug(f"✅ MainWindow tem {len(children)} filhos diretos")
         except Exception as e:
             self.fail(f"Erro na integração de widgets: {e}")
     
     def test_services_integration(self):
         """Testa se os serviços estão integrados corretamente na GUI."""
         try:
-            main_window = MainWindow(self.container)
+            main_window = self.main_window
             
             # Verificar se os serviços essenciais estão disponíveis
-            essential_services = [
-                ("SystemInfoService", self.container.get_system_info_service),
-                ("DriveDetectionService", self.container.get_drive_detection_service),
-                ("ConfigurationService", self.container.get_configuration_service),
-                ("SystemStatsService", self.container.get_system_stats_service)
-            ]
-            
-            for service_name, service_getter in essential_services:
-                service = service_getter()
-                self.assertIsNotNone(service, f"{service_name} deve estar disponível")
+            for name in ESSENTIAL_SERVICES:
+                service = getattr(self.container, f"get_{name}")()
+                self.assertIsNotNone(service, f"{name} deve estar disponível")
             
-            print("✅ Todos os serviços essenciais estão integrados")
+            log.debug("✅ Todos os serviços essenciais estão integrados")
         except Exception as e:
             self.fail(f"Erro na integração de serviços: {e}")
     
     def test_window_show_hide(self):
         """Testa se a janela pode ser exibida e ocultada."""
         try:
-            main_window = MainWindow(self.container)
+            main_window = self.main_window
             
             # Testar exibição
             main_window.show()
@@ -120,14 +131,14 @@ class TestGUIIntegration(unittest.TestCase):
             main_window.hide()
             self.assertFalse(main_window.isVisible(), "Janela deve estar oculta após hide()")
             
-            print("✅ Exibição e ocultação da janela funcionando")
+            log.debug("✅ Exibição e ocultação da janela funcionando")
         except Exception as e:
             self.fail(f"Erro ao exibir/ocultar janela: {e}")
     
     def test_window_resize(self):
         """Testa se a janela pode ser redimensionada."""
         try:
-            main_window = MainWindow(self.container)
+            main_window = self.main_window
             
             # Testar redimensionamento
             main_window.resize(800, 600)
@@ -135,7 +146,7 @@ class TestGUIIntegration(unittest.TestCase):
             self.assertEqual(size.width(), 800, "Largura deve ser 800")
             self.assertEqual(size.height(), 600, "Altura deve ser 600")
             
-            print("✅ Redimensionamento da janela funcionando")
+            log.debug("✅ Redimensionamento da janela funcionando")
         except Exception as e:
             self.fail(f"Erro ao redimensionar janela: {e}")
 
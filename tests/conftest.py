@@ -24,18 +24,24 @@ paths_to_add = [
     str(project_root / "meta" / "config"),  # For path configuration
 ]
 
+existing_paths = set(sys.path)
 for path in paths_to_add:
-    if path not in sys.path:
+    if path not in existing_paths:
         sys.path.insert(0, path)
+        existing_paths.add(path)
 
 # Set environment variables for testing
 os.environ["PYTHONPATH"] = str(src_path)
+# Headless Qt; set at import so every pytest-xdist worker inherits it
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
-print("Test configuration loaded:")
-print(f"  Project root: {project_root}")
-print(f"  App path: {app_path}")
-print(f"  SD Emulation GUI path: {sd_emulation_gui_path}")
-print(f"  Src path: {src_path}")
-print(f"  Meta config path: {project_root}/meta/config")
-print(f"  PYTHONPATH: {os.environ.get('PYTHONPATH', 'Not set')}")
-print(f"  First 5 sys.path entries: {sys.path[:5]}")
+# Path diagnostics are opt-in; otherwise every pytest-xdist worker prints them
+if os.environ.get("FRONTEMU_DEBUG_CONFTEST"):
+    print("Test configuration loaded:")
+    print(f"  Project root: {project_root}")
+    print(f"  App path: {app_path}")
+    print(f"  SD Emulation GUI path: {sd_emulation_gui_path}")
+    print(f"  Src path: {src_path}")
+    print(f"  Meta config path: {project_root}/meta/config")
+    print(f"  PYTHONPATH: {os.environ.get('PYTHONPATH', 'Not set')}")
+    print(f"  First 5 sys.path entries: {sys.path[:5]}")
@@ -0,0 +1,16 @@
+"""
+Helpers shared by the test suite and the standalone test scripts.
+
+Plain module with no pytest dependency, so the root scripts
+(test_final_validation.py, test_gui_integration.py) can import it even
+where pytest is not installed.
+"""
+
+# Services every configured container must provide; each name maps to a
+# get_<name>() getter on DependencyContainer.
+ESSENTIAL_SERVICES = (
+    "system_info_service",
+    "drive_detection_service",
+    "configuration_service",
+    "system_stats_service",
+)
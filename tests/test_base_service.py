@@ -14,14 +14,21 @@ class TestService(BaseService):
     def initialize(self):
         self.initialized_flag = True
 
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """Session-wide temp dir; tests write under their own subdirectory."""
+    return tmp_path_factory.mktemp("svc_tests")
+
+
 class TestBaseService:
     """Test cases for BaseService class."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_path_config(self):
-        """Mock PathConfigManager."""
-        with patch('meta.config.path_config.PathConfigManager') as mock:
-            yield mock
+        """Mock PathConfigManager once for every test in the module."""
+        patcher = patch('meta.config.path_config.PathConfigManager')
+        yield patcher.start()
+        patcher.stop()
     
     def test_service_initialization_success(self, mock_path_config):
         """Test successful service initialization."""
@@ -67,18 +74,18 @@ class TestBaseService:
         
         assert service.validate_path_exists(non_existing) == False
         
-    def test_validate_path_create_missing_file(self, mock_path_config, tmp_path):
+    def test_validate_path_create_missing_file(self, mock_path_config, shared_tmp, request):
         """Test path validation with file creation."""
         service = TestService()
-        missing_file = tmp_path / "missing" / "file.txt"
+        missing_file = shared_tmp / request.node.name / "missing" / "file.txt"
         
         assert service.validate_path_exists(missing_file, create_if_missing=True) == True
         assert missing_file.parent.exists() == True
         
-    def test_validate_path_create_missing_directory(self, mock_path_config, tmp_path):
+    def test_validate_path_create_missing_directory(self, mock_path_config, shared_tmp, request):
         """Test path validation with directory creation."""
         service = TestService()
-        missing_dir = tmp_path / "missing" / "directory"
+        missing_dir = shared_tmp / request.node.name / "missing" / "directory"
         
         assert service.validate_path_exists(missing_dir, create_if_missing=True) == True
         assert missing_dir.exists() == True
@@ -1,8 +1,8 @@
 """Tests for ConfigLoader adapter."""
 
 import json
-import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
@@ -12,6 +12,16 @@ from adapters.config_loader import ConfigCache, ConfigLoader, ConfigurationError
 from domain.models import AppConfig
 
 
+def _write_json(path: Path, data) -> None:
+    """Write ``data`` as JSON in a single call."""
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _read_json(path: Path):
+    """Read a JSON file in a single call."""
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
 class TestModel(BaseModel):
     """Test model for configuration testing."""
     name: str
@@ -22,6 +32,12 @@ class TestModel(BaseModel):
 class TestConfigCache:
     """Test cases for ConfigCache."""
 
+    @pytest.fixture
+    def clock(self):
+        """Manually advanced clock, in nanoseconds, for ConfigCache."""
+        current_time = [0]
+        return current_time
+
     def test_cache_init(self):
         """Test cache initialization."""
         cache = ConfigCache()
@@ -43,10 +59,9 @@ class TestConfigCache:
         # Test non-existent key
         assert cache.get("non_existent") is None
 
-    def test_cache_expiration(self):
+    def test_cache_expiration(self, clock):
         """Test cache expiration functionality."""
-        import time
-        cache = ConfigCache()
+        cache = ConfigCache(time_func=lambda: clock[0])
         test_data = {"key": "value"}
         
         # Set with very short TTL
@@ -56,11 +71,38 @@ class TestConfigCache:
         result = cache.get("test_key")
         assert result == test_data
         
-        # Wait for expiration and check again
-        time.sleep(1.1)
+        # Advance past expiration and check again
+        clock[0] += 1_100_000_000
         result = cache.get("test_key")
         assert result is None
 
+    def test_cache_evicts_least_recently_used(self):
+        """Test the size bound evicts the least recently used entry."""
+        cache = ConfigCache(max_entries=2)
+
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        cache.get("key1")
+        cache.set("key3", "value3")
+
+        assert cache.get("key2") is None
+        assert cache.get("key1") == "value1"
+        assert cache.get("key3") == "value3"
+        assert cache.get_stats()["total_entries"] == 2
+
+    def test_signature_cache_is_bounded(self):
+        """Test file-signature entries follow the same LRU size bound."""
+        cache = ConfigCache(max_entries=2)
+
+        cache.set_with_signature("a.json", (1, 10), "a")
+        cache.set_with_signature("b.json", (1, 20), "b")
+        cache.get_if_unchanged("a.json", (1, 10))
+        cache.set_with_signature("c.json", (1, 30), "c")
+
+        assert cache.get_if_unchanged("b.json", (1, 20)) is None
+        assert cache.get_if_unchanged("a.json", (1, 10)) == "a"
+        assert cache.get_if_unchanged("c.json", (1, 30)) == "c"
+
     def test_cache_invalidate(self):
         """Test cache invalidation."""
         cache = ConfigCache()
@@ -83,10 +125,9 @@ class TestConfigCache:
         assert cache.get("key1") is None
         assert cache.get("key2") is None
 
-    def test_cache_stats(self):
+    def test_cache_stats(self, clock):
         """Test cache statistics."""
-        import time
-        cache = ConfigCache()
+        cache = ConfigCache(time_func=lambda: clock[0])
         
         # Empty cache
         stats = cache.get_stats()
@@ -102,8 +143,8 @@ class TestConfigCache:
         assert stats["total_entries"] == 2
         assert stats["active_entries"] == 2
         
-        # Wait for expiration
-        time.sleep(1.1)
+        # Advance past expiration
+        clock[0] += 1_100_000_000
         stats = cache.get_stats()
         assert stats["total_entries"] == 2
         assert stats["expired_entries"] == 1
@@ -113,12 +154,15 @@ class TestConfigLoader:
     """Test cases for ConfigLoader."""
 
     @pytest.fixture
-    def temp_config_dir(self):
-        """Create temporary directory for config files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+    def temp_config_dir(self, tmp_path):
+        """Temporary directory for config files.
 
-    @pytest.fixture
+        pytest prunes old tmp_path trees in later sessions, so no tests pay
+        for an rmtree at teardown.
+        """
+        return tmp_path
+
+    @pytest.fixture(scope="session")
     def sample_config_data(self):
         """Sample configuration data."""
         return {
@@ -129,12 +173,14 @@ class TestConfigLoader:
 
     @pytest.fixture
     def config_loader(self, temp_config_dir):
-        """Create ConfigLoader instance with temporary directory."""
-        with patch('adapters.config_loader.PathResolver') as mock_resolver:
-            mock_resolver.return_value.resolve_path.return_value = str(temp_config_dir)
-            loader = ConfigLoader(base_path=temp_config_dir)
-            loader._config_types["test_config.json"] = TestModel
-            return loader
+        """Create ConfigLoader instance with temporary directory.
+
+        An explicit base_path means the resolver is never asked for one, so
+        no patching is needed.
+        """
+        loader = ConfigLoader(base_path=temp_config_dir)
+        loader._config_types["test_config.json"] = TestModel
+        return loader
 
     def test_config_loader_init(self, temp_config_dir):
         """Test ConfigLoader initialization."""
@@ -145,17 +191,18 @@ class TestConfigLoader:
 
     def test_config_loader_init_no_base_path(self):
         """Test ConfigLoader initialization without base path."""
-        with patch('adapters.config_loader.PathResolver') as mock_resolver:
-            mock_resolver.return_value.resolve_path.return_value = "\\test\\path"
-            loader = ConfigLoader()
-            assert str(loader.base_path) == "\\test\\path"
+        class FakeResolver:
+            def resolve_path(self, key):
+                return SimpleNamespace(resolved_path="\\test\\path")
+
+        loader = ConfigLoader(path_resolver=FakeResolver())
+        assert str(loader.base_path) == "\\test\\path"
 
     def test_load_config_success(self, config_loader, temp_config_dir, sample_config_data):
         """Test successful configuration loading."""
         # Create test config file
         config_file = temp_config_dir / "test_config.json"
-        with open(config_file, 'w') as f:
-            json.dump(sample_config_data, f)
+        _write_json(config_file, sample_config_data)
         
         # Load configuration
         config = config_loader.load_config("test_config.json", TestModel)
@@ -174,8 +221,7 @@ class TestConfigLoader:
         """Test loading configuration with invalid JSON."""
         # Create invalid JSON file
         config_file = temp_config_dir / "invalid.json"
-        with open(config_file, 'w') as f:
-            f.write("{ invalid json }")
+        config_file.write_text("{ invalid json }")
         
         config_loader._config_types["invalid.json"] = TestModel
         
@@ -187,8 +233,7 @@ class TestConfigLoader:
         # Create config with missing required field
         invalid_data = {"value": 42}  # Missing 'name' field
         config_file = temp_config_dir / "invalid_config.json"
-        with open(config_file, 'w') as f:
-            json.dump(invalid_data, f)
+        _write_json(config_file, invalid_data)
         
         config_loader._config_types["invalid_config.json"] = TestModel
         
@@ -199,8 +244,7 @@ class TestConfigLoader:
         """Test configuration loading with caching."""
         # Create test config file
         config_file = temp_config_dir / "test_config.json"
-        with open(config_file, 'w') as f:
-            json.dump(sample_config_data, f)
+        _write_json(config_file, sample_config_data)
         
         # Load configuration twice
         config1 = config_loader.load_config("test_config.json", TestModel, use_cache=True)
@@ -209,12 +253,32 @@ class TestConfigLoader:
         # Should be the same cached instance
         assert config1 is config2
 
+    def test_load_config_unchanged_file_skips_parse(self, config_loader, temp_config_dir, sample_config_data):
+        """Test an unchanged file is served from the stat cache without re-reading."""
+        config_file = temp_config_dir / "test_config.json"
+        _write_json(config_file, sample_config_data)
+
+        with patch('adapters.config_loader.cache_manager') as mock_manager:
+            mock_manager.get.return_value = None
+            mock_manager.cache_file_content.side_effect = lambda path, ttl: Path(path).read_text()
+
+            config1 = config_loader.load_config("test_config.json", TestModel)
+            config2 = config_loader.load_config("test_config.json", TestModel)
+
+            assert config1 is config2
+            mock_manager.cache_file_content.assert_called_once()
+
+            # A rewrite with a different size invalidates the entry
+            _write_json(config_file, {**sample_config_data, "value": 4242})
+            config3 = config_loader.load_config("test_config.json", TestModel)
+
+        assert config3.value == 4242
+
     def test_load_config_without_cache(self, config_loader, temp_config_dir, sample_config_data):
         """Test configuration loading without caching."""
         # Create test config file
         config_file = temp_config_dir / "test_config.json"
-        with open(config_file, 'w') as f:
-            json.dump(sample_config_data, f)
+        _write_json(config_file, sample_config_data)
         
         # Load configuration twice without cache
         config1 = config_loader.load_config("test_config.json", TestModel, use_cache=False)
@@ -263,8 +327,7 @@ class TestConfigLoader:
         
         # Use a known config filename that maps to AppConfig
         config_file = temp_config_dir / "config.json"
-        with open(config_file, "w") as f:
-            json.dump(config_data, f)
+        _write_json(config_file, config_data)
         
         # Should auto-detect as AppConfig based on filename
         result = config_loader.load_config("config.json")
@@ -275,8 +338,7 @@ class TestConfigLoader:
         """Test configuration reloading."""
         # Create test config file
         config_file = temp_config_dir / "test_config.json"
-        with open(config_file, 'w') as f:
-            json.dump(sample_config_data, f)
+        _write_json(config_file, sample_config_data)
         
         # Load and cache
         config1 = config_loader.load_config("test_config.json", TestModel)
@@ -284,8 +346,7 @@ class TestConfigLoader:
         # Modify file
         modified_data = sample_config_data.copy()
         modified_data["value"] = 100
-        with open(config_file, 'w') as f:
-            json.dump(modified_data, f)
+        _write_json(config_file, modified_data)
         
         # Reload should get fresh data
         config2 = config_loader.reload_config("test_config.json", TestModel)
@@ -294,7 +355,7 @@ class TestConfigLoader:
 
     def test_save_config(self, config_loader, temp_config_dir):
         """Test configuration saving."""
-        test_config = TestModel(name="saved_config", value=123)
+        test_config = TestModel.model_construct(name="saved_config", value=123, enabled=True)
         
         # Save configuration
         config_loader.save_config("saved_config.json", test_config)
@@ -304,8 +365,7 @@ class TestConfigLoader:
         assert config_file.exists()
         
         # Verify content
-        with open(config_file) as f:
-            data = json.load(f)
+        data = _read_json(config_file)
         
         assert data["name"] == "saved_config"
         assert data["value"] == 123
@@ -316,11 +376,10 @@ class TestConfigLoader:
         # Create existing file
         config_file = temp_config_dir / "existing_config.json"
         original_data = {"name": "original", "value": 1}
-        with open(config_file, 'w') as f:
-            json.dump(original_data, f)
+        _write_json(config_file, original_data)
         
         # Save new configuration with backup
-        new_config = TestModel(name="updated", value=2)
+        new_config = TestModel.model_construct(name="updated", value=2, enabled=True)
         config_loader.save_config("existing_config.json", new_config, backup=True)
         
         # Check backup was created
@@ -328,8 +387,7 @@ class TestConfigLoader:
         assert len(backup_files) == 1
         
         # Verify backup content
-        with open(backup_files[0]) as f:
-            backup_data = json.load(f)
+        backup_data = _read_json(backup_files[0])
         assert backup_data == original_data
 
     def test_list_config_files(self, config_loader, temp_config_dir):
@@ -339,8 +397,7 @@ class TestConfigLoader:
         
         for filename in ["config.json", "platform_mapping.json"]:
             config_file = temp_config_dir / filename
-            with open(config_file, 'w') as f:
-                json.dump(config_data, f)
+            _write_json(config_file, config_data)
         
         # List files
         files = config_loader.list_config_files()
@@ -358,8 +415,7 @@ class TestConfigLoader:
         """Test configuration file validation."""
         # Create valid config file
         config_file = temp_config_dir / "test_config.json"
-        with open(config_file, 'w') as f:
-            json.dump(sample_config_data, f)
+        _write_json(config_file, sample_config_data)
         
         # Validate
         result = config_loader.validate_config_file("test_config.json")
@@ -374,8 +430,7 @@ class TestConfigLoader:
         # Create invalid config file
         invalid_data = {"value": "not_an_int"}  # Wrong type
         config_file = temp_config_dir / "test_config.json"
-        with open(config_file, 'w') as f:
-            json.dump(invalid_data, f)
+        _write_json(config_file, invalid_data)
         
         # Validate
         result = config_loader.validate_config_file("test_config.json")
@@ -395,8 +450,7 @@ class TestConfigLoader:
         """Test clearing configuration cache."""
         # Create and load config to populate cache
         config_file = temp_config_dir / "test_config.json"
-        with open(config_file, 'w') as f:
-            json.dump(sample_config_data, f)
+        _write_json(config_file, sample_config_data)
         
         config_loader.load_config("test_config.json", TestModel)
         
@@ -438,8 +492,7 @@ class TestConfigLoader:
         
         # Create config.json which is a known config type
         config_file = temp_config_dir / "config.json"
-        with open(config_file, "w") as f:
-            json.dump(config_data, f)
+        _write_json(config_file, config_data)
         
         all_configs = config_loader.load_all_configs()
         # Should have at least the config.json we created
@@ -450,7 +503,7 @@ class TestConfigLoader:
 
     def test_save_config_without_backup(self, config_loader, temp_config_dir):
         """Test configuration saving without backup."""
-        test_config = TestModel(name="no_backup_config", value=456)
+        test_config = TestModel.model_construct(name="no_backup_config", value=456, enabled=True)
         
         # Save configuration without backup
         config_loader.save_config("no_backup_config.json", test_config, backup=False)
@@ -460,15 +513,14 @@ class TestConfigLoader:
         assert config_file.exists()
         
         # Verify content
-        with open(config_file) as f:
-            data = json.load(f)
+        data = _read_json(config_file)
         
         assert data["name"] == "no_backup_config"
         assert data["value"] == 456
 
     def test_save_config_validation_disabled(self, config_loader, temp_config_dir):
         """Test configuration saving with validation disabled."""
-        test_config = TestModel(name="no_validation", value=789)
+        test_config = TestModel.model_construct(name="no_validation", value=789, enabled=True)
         
         # Save configuration without validation
         config_loader.save_config("no_validation.json", test_config, validate=False)
@@ -481,8 +533,7 @@ class TestConfigLoader:
         """Test loading configuration without schema validation."""
         # Create test config file
         config_file = temp_config_dir / "test_config.json"
-        with open(config_file, 'w') as f:
-            json.dump(sample_config_data, f)
+        _write_json(config_file, sample_config_data)
         
         # Load configuration without validation
         config = config_loader.load_config("test_config.json", TestModel, validate_schema=False)
@@ -511,8 +562,7 @@ class TestConfigLoader:
         """Test loading configuration that is not a JSON object."""
         # Create config file with array instead of object
         config_file = temp_config_dir / "array_config.json"
-        with open(config_file, 'w') as f:
-            json.dump(["not", "an", "object"], f)
+        _write_json(config_file, ["not", "an", "object"])
         
         config_loader._config_types["array_config.json"] = TestModel
         
@@ -523,12 +573,11 @@ class TestConfigLoader:
         """Test backup creation failure handling."""
         # Create existing file
         config_file = temp_config_dir / "backup_test.json"
-        with open(config_file, 'w') as f:
-            json.dump({"test": "data"}, f)
+        _write_json(config_file, {"test": "data"})
         
-        # Mock shutil.copy2 to raise an exception
-        with patch('shutil.copy2', side_effect=OSError("Permission denied")):
-            test_config = TestModel(name="backup_fail", value=999)
+        # Mock shutil.copyfile to raise an exception
+        with patch('shutil.copyfile', side_effect=OSError("Permission denied")):
+            test_config = TestModel.model_construct(name="backup_fail", value=999, enabled=True)
             
             with pytest.raises(ConfigurationError, match="Failed to save configuration"):
                 config_loader.save_config("backup_test.json", test_config, backup=True)
\ No newline at end of file
@@ -1,11 +1,13 @@
 """Tests for config.config_manager module."""
 
+import copy
 import json
+import shutil
 import tempfile
 import threading
 import unittest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 from meta.config.config_manager import (
     ConfigFormat,
@@ -23,6 +25,40 @@ from meta.config.config_manager import (
 )
 
 
+class _AlwaysFailValidator:
+    """Validator stub that rejects every value."""
+
+    def validate(self, *_):
+        return False
+
+    def get_error_message(self):
+        return "Validation failed"
+
+
+class _AlwaysPassValidator:
+    """Validator stub that accepts every value."""
+
+    def validate(self, *_):
+        return True
+
+    def get_error_message(self):
+        return ""
+
+
+class RecordingLoader:
+    """Loader stub that returns fixed data and records saves."""
+
+    def __init__(self, data=None):
+        self.data = data
+        self.calls = []
+
+    def load(self, *_):
+        return self.data
+
+    def save(self, *args):
+        self.calls.append(args)
+
+
 class TestConfigFormat(unittest.TestCase):
     """Test ConfigFormat enum."""
 
@@ -287,27 +323,34 @@ class TestEnvConfigLoader(unittest.TestCase):
 class TestConfigManager(unittest.TestCase):
     """Test ConfigManager class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Build one baseline manager shared by every test."""
+        cls.temp_dir = tempfile.mkdtemp()
 
         with (
             patch(
                 "utils.path_utils.PathUtils.normalize_path",
-                return_value=Path(self.temp_dir),
+                return_value=Path(cls.temp_dir),
             ),
             patch("utils.file_utils.FileUtils.ensure_directory_exists"),
             patch("utils.path_utils.PathUtils.path_exists", return_value=True),
             patch("utils.file_utils.FileUtils.list_files", return_value=[]),
         ):
 
-            self.config_manager = ConfigManager(self.temp_dir)
+            cls._base_manager = ConfigManager(cls.temp_dir)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test fixtures."""
-        import shutil
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
 
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    def setUp(self):
+        """Give each test its own copy of the baseline manager."""
+        self.config_manager = copy.copy(self._base_manager)
+        self.config_manager._configs = {}
+        self.config_manager._metadata = {}
+        self.config_manager._loaders = dict(self._base_manager._loaders)
 
     def test_init_creates_config_dir(self):
         """Test that initialization creates config directory."""
@@ -370,10 +413,7 @@ class TestConfigManager(unittest.TestCase):
         """Test loading configuration file."""
         mock_get_time.return_value = 1234567890
 
-        # Mock loader
-        mock_loader = Mock()
-        mock_loader.load.return_value = {"key": "value"}
-        self.config_manager._loaders[ConfigFormat.JSON] = mock_loader
+        self.config_manager._loaders[ConfigFormat.JSON] = RecordingLoader({"key": "value"})
 
         self.config_manager._load_config_file(
             "/test/config.json", ConfigScope.PROJECT, ConfigFormat.JSON
@@ -396,13 +436,12 @@ class TestConfigManager(unittest.TestCase):
             source_file="/test/config.json",
         )
 
-        # Mock loader
-        mock_loader = Mock()
-        self.config_manager._loaders[ConfigFormat.JSON] = mock_loader
+        loader = RecordingLoader()
+        self.config_manager._loaders[ConfigFormat.JSON] = loader
 
         self.config_manager.save_scope(ConfigScope.PROJECT)
 
-        mock_loader.save.assert_called_once_with("/test/config.json", {"key": "value"})
+        self.assertEqual(loader.calls, [("/test/config.json", {"key": "value"})])
 
     def test_save_all(self):
         """Test saving all configurations."""
@@ -439,18 +478,18 @@ class TestConfigManager(unittest.TestCase):
 
     def test_validation_on_set(self):
         """Test validation when setting values."""
-        # Mock validator that always fails
-        mock_validator = Mock()
-        mock_validator.validate.return_value = False
-        mock_validator.get_error_message.return_value = "Validation failed"
-
-        self.config_manager._validators = [mock_validator]
+        self.config_manager._validators = [_AlwaysFailValidator()]
 
         with self.assertRaises(ValueError) as context:
             self.config_manager.set("test_key", "invalid_value")
 
         self.assertIn("Configuration validation failed", str(context.exception))
 
+        self.config_manager._validators = [_AlwaysPassValidator()]
+        with patch.object(self.config_manager, "save_scope"):
+            self.config_manager.set("test_key", "valid_value")
+        self.assertEqual(self.config_manager.get("test_key"), "valid_value")
+
     def test_thread_safety(self):
         """Test thread safety of configuration operations."""
         results = []
@@ -481,6 +520,39 @@ class TestConfigManager(unittest.TestCase):
         for i, result in enumerate(results):
             self.assertEqual(result, f"value_{i}")
 
+    def test_concurrent_reads_during_writes(self):
+        """Test readers only ever see missing or fully written values."""
+        keys = [f"rw_key_{i}" for i in range(20)]
+        errors = []
+
+        def reader():
+            try:
+                for _ in range(1000):
+                    for key in keys:
+                        value = self.config_manager.get(key, default=None)
+                        if value not in (None, f"{key}_value"):
+                            errors.append(value)
+            except Exception as e:
+                errors.append(e)
+
+        def writer(own_keys):
+            for key in own_keys:
+                self.config_manager.set(key, f"{key}_value", save_immediately=False)
+
+        with patch.object(self.config_manager, "save_scope"):
+            threads = [threading.Thread(target=reader) for _ in range(8)]
+            threads += [
+                threading.Thread(target=writer, args=(keys[i::2],)) for i in range(2)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(errors, [])
+        for key in keys:
+            self.assertEqual(self.config_manager.get(key), f"{key}_value")
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -9,9 +9,12 @@ Author: SD Emulation Team
 Date: 2025-01-19
 """
 
+import functools
 import json
+import re
 import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path - conftest.py already handles this
@@ -19,6 +22,54 @@ project_root = Path(__file__).parent.parent
 src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
+# Drive-letter paths as they appear in Python source: "C:/" or an escaped
+# "C:\\" inside a string literal
+_HARDCODED_SOURCE_RE = re.compile(r"[CF]:(?:/|\\\\)")
+
+# Drive-letter paths inside JSON string values ("C:/" or "C:\")
+_HARDCODED_VALUE_RE = re.compile(r"[CF]:[/\\]")
+
+# Lines of the main source files allowed to mention such paths: comments,
+# docstrings, examples and tests
+_SOURCE_SKIP_RE = re.compile(r"^\s*#|\"\"\"|'''|example|test|# e\.g\.", re.IGNORECASE)
+
+# Same for migration_service.py, which also documents paths in CLI help
+_MIGRATION_SKIP_RE = re.compile(r"^\s*#|\"\"\"|'''|description=|help=")
+
+
+# Key source files checked for hardcoded paths
+SOURCE_FILES = (
+    project_root / "meta" / "config" / "path_resolver.py",
+    project_root / "meta" / "config" / "path_config.py",
+    project_root / "src" / "sd_emulation_gui" / "adapters" / "fs_adapter.py",
+    project_root / "src" / "sd_emulation_gui" / "services" / "migration_service.py",
+    project_root / "src" / "sd_emulation_gui" / "gui" / "main_window.py",
+    project_root / "src" / "sd_emulation_gui" / "domain" / "sd_rules.py",
+)
+MIGRATION_SERVICE_FILE = SOURCE_FILES[3]
+
+
+@functools.lru_cache(maxsize=128)
+def _read_source(path):
+    """Read a source file once per session; None when it does not exist."""
+    path = Path(path)
+    return path.read_text(encoding="utf-8") if path.exists() else None
+
+
+def _find_hardcoded_line(content, skip_re):
+    """Return (line_num, line, match) for the first non-skipped hardcoded path.
+
+    The whole file is checked with one regex scan first; lines are only
+    inspected when that scan finds something.
+    """
+    if _HARDCODED_SOURCE_RE.search(content) is None:
+        return None
+    for line_num, line in enumerate(content.split("\n"), 1):
+        match = _HARDCODED_SOURCE_RE.search(line)
+        if match and not skip_re.search(line):
+            return line_num, line, match
+    return None
+
 
 class TestDynamicPaths(unittest.TestCase):
     """Testes para validar o sistema de paths dinâmicos."""
@@ -31,67 +82,54 @@ class TestDynamicPaths(unittest.TestCase):
             with open(config_file, encoding="utf-8") as f:
                 config_data = json.load(f)
 
-            # Verifica se os valores são null ou não contêm paths hardcoded
-            hardcoded_patterns = ["F:/", "F:\\", "C:/", "C:\\"]
+            # Verifica se os valores são null ou não contêm paths hardcoded.
+            # One scan of the serialized config clears the common case; the
+            # tree is only walked to name the offending entry.
+            if _HARDCODED_VALUE_RE.search(json.dumps(config_data)) is None:
+                return
 
-            def check_dict_values(data, path=""):
+            stack = [(config_data, "")]
+            while stack:
+                data, path = stack.pop()
                 if isinstance(data, dict):
-                    for key, value in data.items():
-                        current_path = f"{path}.{key}" if path else key
-                        if isinstance(value, str):
-                            for pattern in hardcoded_patterns:
-                                self.assertNotIn(
-                                    pattern,
-                                    value,
-                                    f"Hardcoded path '{pattern}' found in {current_path}: {value}",
-                                )
-                        elif isinstance(value, (dict, list)):
-                            check_dict_values(value, current_path)
+                    items = ((f"{path}.{key}" if path else key, value) for key, value in data.items())
                 elif isinstance(data, list):
-                    for i, item in enumerate(data):
-                        check_dict_values(item, f"{path}[{i}]")
-
-            check_dict_values(config_data)
+                    items = ((f"{path}[{i}]", item) for i, item in enumerate(data))
+                else:
+                    continue
+
+                for current_path, value in items:
+                    if isinstance(value, str):
+                        match = _HARDCODED_VALUE_RE.search(value)
+                        if match:
+                            self.fail(
+                                f"Hardcoded path '{match.group(0)}' found in {current_path}: {value}"
+                            )
+                    elif isinstance(value, (dict, list)):
+                        stack.append((value, current_path))
 
     def test_no_hardcoded_strings_in_source(self):
         """Testa se não há strings hardcoded nos arquivos fonte principais."""
-        # Check key source files for hardcoded paths
-        source_files = [
-            project_root / "meta" / "config" / "path_resolver.py",
-            project_root / "meta" / "config" / "path_config.py",
-            project_root / "src" / "sd_emulation_gui" / "adapters" / "fs_adapter.py",
-            project_root / "src" / "sd_emulation_gui" / "services" / "migration_service.py",
-            project_root / "src" / "sd_emulation_gui" / "gui" / "main_window.py",
-            project_root / "src" / "sd_emulation_gui" / "domain" / "sd_rules.py",
-        ]
-
-        hardcoded_patterns = ["F:/", "F:\\\\", "C:/", "C:\\\\"]
-
-        for file_path in source_files:
-            if file_path.exists():
-                with open(file_path, encoding="utf-8") as f:
-                    content = f.read()
-                    for pattern in hardcoded_patterns:
-                        # Allow patterns in comments or test data
-                        lines = content.split("\n")
-                        for line_num, line in enumerate(lines, 1):
-                            if pattern in line:
-                                # Skip if it's in a comment, docstring, or example
-                                line_stripped = line.strip()
-                                if (
-                                    line_stripped.startswith("#")
-                                    or '"""' in line
-                                    or "'''" in line
-                                    or "example" in line.lower()
-                                    or "test" in line.lower()
-                                    or "# Example:" in line
-                                    or "# e.g." in line.lower()
-                                ):
-                                    continue
-
-                                self.fail(
-                                    f"Hardcoded path '{pattern}' found in {file_path.name}:{line_num}: {line.strip()}"
-                                )
+        # Check key source files for hardcoded paths; the reads and the
+        # whole-file prechecks overlap across threads
+        def scan(file_path):
+            content = _read_source(str(file_path))
+            if content is None or _HARDCODED_SOURCE_RE.search(content) is None:
+                return None
+            return content
+
+        with ThreadPoolExecutor(max_workers=min(8, len(SOURCE_FILES))) as executor:
+            contents = list(executor.map(scan, SOURCE_FILES))
+
+        for file_path, content in zip(SOURCE_FILES, contents):
+            if content is None:
+                continue
+            found = _find_hardcoded_line(content, _SOURCE_SKIP_RE)
+            if found:
+                line_num, line, match = found
+                self.fail(
+                    f"Hardcoded path '{match.group(0)}' found in {file_path.name}:{line_num}: {line.strip()}"
+                )
 
     def test_path_config_structure(self):
         """Testa se o arquivo de configuração de paths não contém paths hardcoded."""
@@ -117,34 +155,17 @@ class TestDynamicPaths(unittest.TestCase):
 
     def test_migration_service_no_hardcoded_paths(self):
         """Testa se migration_service.py não contém paths hardcoded."""
-        migration_file = project_root / "src" / "sd_emulation_gui" / "services" / "migration_service.py"
-
-        if migration_file.exists():
-            with open(migration_file, encoding="utf-8") as f:
-                content = f.read()
-
-            # Verifica se não há paths hardcoded no código
-            hardcoded_patterns = ["F:/", "F:\\\\", "C:/", "C:\\\\"]
-
-            for pattern in hardcoded_patterns:
-                # Conta ocorrências que não são comentários
-                lines = content.split("\n")
-                for line_num, line in enumerate(lines, 1):
-                    if pattern in line:
-                        line_stripped = line.strip()
-                        # Skip comments, docstrings, and examples
-                        if (
-                            line_stripped.startswith("#")
-                            or '"""' in line
-                            or "'''" in line
-                            or "description=" in line
-                            or "help=" in line
-                        ):
-                            continue
-
-                        self.fail(
-                            f"Hardcoded path '{pattern}' found in migration_service.py:{line_num}: {line.strip()}"
-                        )
+        content = _read_source(str(MIGRATION_SERVICE_FILE))
+        if content is None:
+            return
+
+        # Verifica se não há paths hardcoded no código
+        found = _find_hardcoded_line(content, _MIGRATION_SKIP_RE)
+        if found:
+            line_num, line, match = found
+            self.fail(
+                f"Hardcoded path '{match.group(0)}' found in migration_service.py:{line_num}: {line.strip()}"
+            )
 
 
 if __name__ == "__main__":
@@ -17,7 +17,6 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from PySide6.QtCore import QTimer
-from PySide6.QtWidgets import QApplication
 
 from sd_emulation_gui.domain.sd_rules import SDEmulationRules
 from sd_emulation_gui.gui.main_window import MainWindow
@@ -25,15 +24,6 @@ from sd_emulation_gui.services.migration_service import MigrationService
 from sd_emulation_gui.services.validation_service import ValidationService
 
 
-@pytest.fixture(scope="session")
-def qapp():
-    """Fixture para QApplication única para todos os testes E2E."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return app
-
-
 @pytest.fixture
 def temp_base_path():
     """Fixture para diretório temporário base para testes."""
@@ -0,0 +1,59 @@
+"""Unit tests for json_utils module.
+
+Tests JSON parsing and serialization with and without the memory-mapped
+path for large files.
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from utils.json_utils import dumps_json, load_json_file, loads_json
+
+
+class TestJsonUtils(unittest.TestCase):
+    """Test cases for json_utils helpers."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+
+    def test_loads_json_invalid_raises_stdlib_error(self):
+        """Test invalid input raises json.JSONDecodeError with either parser."""
+        self.assertEqual(loads_json('{"a": 1}'), {"a": 1})
+        with self.assertRaises(json.JSONDecodeError):
+            loads_json("{invalid")
+
+    def test_load_json_file_small_and_mapped(self):
+        """Test files below and above the mmap threshold parse the same."""
+        data = {"items": list(range(50))}
+        path = self.temp_dir / "data.json"
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+        with open(path, "rb") as f:
+            self.assertEqual(load_json_file(f), data)
+        with patch("utils.json_utils.JSON_MMAP_THRESHOLD", 1):
+            with open(path, "rb") as f:
+                self.assertEqual(load_json_file(f), data)
+
+    def test_dumps_json_round_trip(self):
+        """Test serialized output is indented UTF-8 that parses back."""
+        data = {"name": "café", "nested": {"value": 1}}
+
+        payload = dumps_json(data)
+
+        self.assertIsInstance(payload, bytes)
+        self.assertIn(b"\n  ", payload)
+        self.assertEqual(json.loads(payload.decode("utf-8")), data)
+
+    def test_dumps_json_falls_back_for_non_str_keys(self):
+        """Test data orjson rejects is still serialized."""
+        self.assertEqual(json.loads(dumps_json({1: "a"})), {"1": "a"})
+
+
+if __name__ == "__main__":
+    unittest.main()
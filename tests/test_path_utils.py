@@ -4,6 +4,7 @@ Tests all path manipulation and resolution functions to ensure proper
 functionality across different platforms and scenarios.
 """
 
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -356,6 +357,20 @@ class TestPathUtils(unittest.TestCase):
         self.assertEqual(info["name"], "non_existent.txt")
         self.assertNotIn("size", info)
 
+    def test_get_path_info_from_entry_matches_get_path_info(self):
+        """Test scandir-based path info matches the Path-based variant."""
+        base = Path(self.temp_dir)
+        (base / "archive.tar.gz").write_text("data")
+        (base / ".hidden").write_text("x")
+        (base / "sub").mkdir()
+
+        with os.scandir(base) as entries:
+            for entry in entries:
+                self.assertEqual(
+                    PathUtils.get_path_info_from_entry(entry),
+                    PathUtils.get_path_info(entry.path),
+                )
+
     def test_validate_path_security_allowed(self):
         """Test path security validation for allowed paths."""
         # Create test structure
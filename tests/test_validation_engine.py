@@ -0,0 +1,308 @@
+"""Unit tests for validation_engine module.
+
+Tests the built-in validation rules and the engine that groups and runs them.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from validation.validation_engine import (
+    ConfigurationValidationRule,
+    OperationDataValidationRule,
+    PathValidationRule,
+    ValidationEngine,
+)
+
+
+class TestPathValidationRule(unittest.TestCase):
+    """Test cases for PathValidationRule."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.test_file = Path(self.temp_dir) / "rom.bin"
+        self.test_file.write_text("data")
+
+    def tearDown(self):
+        """Clean up after each test method."""
+        if Path(self.temp_dir).exists():
+            shutil.rmtree(self.temp_dir)
+
+    def test_existing_directory(self):
+        """Test a directory passes directory validation."""
+        rule = PathValidationRule(must_exist=True, must_be_directory=True)
+
+        result = rule.validate(self.temp_dir)
+
+        self.assertTrue(result["is_valid"])
+        self.assertEqual(
+            result["details"]["path_info"],
+            {"exists": True, "is_absolute": True, "is_directory": True, "extension": ""},
+        )
+
+    def test_file_rejected_as_directory(self):
+        """Test a file fails directory validation."""
+        rule = PathValidationRule(must_exist=True, must_be_directory=True)
+
+        result = rule.validate(str(self.test_file))
+
+        self.assertFalse(result["is_valid"])
+        self.assertIn("Path must be a directory", result["details"]["errors"])
+
+    def test_missing_path(self):
+        """Test a missing path reports no filesystem details."""
+        rule = PathValidationRule(must_exist=True)
+
+        result = rule.validate(str(Path(self.temp_dir) / "missing.bin"))
+
+        self.assertFalse(result["is_valid"])
+        self.assertIn("Path does not exist", result["details"]["errors"])
+        self.assertIsNone(result["details"]["path_info"]["is_directory"])
+
+    def test_allowed_extensions(self):
+        """Test extension checks are case-insensitive."""
+        allowed = PathValidationRule(must_be_file=True, allowed_extensions=[".BIN"])
+        denied = PathValidationRule(must_be_file=True, allowed_extensions=[".iso"])
+
+        self.assertTrue(allowed.validate(str(self.test_file))["is_valid"])
+        self.assertFalse(denied.validate(str(self.test_file))["is_valid"])
+
+    def test_relative_path(self):
+        """Test relative paths fail the absolute check."""
+        rule = PathValidationRule(must_exist=False, must_be_absolute=True)
+
+        result = rule.validate("relative/path")
+
+        self.assertFalse(result["is_valid"])
+        self.assertIn("Path must be absolute", result["details"]["errors"])
+
+
+class TestOperationDataValidationRule(unittest.TestCase):
+    """Test cases for OperationDataValidationRule."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.rule = OperationDataValidationRule()
+        self.operation = {
+            "operation_id": "op-1",
+            "operation_type": "migration",
+            "service_name": "migration_service",
+            "status": "completed",
+        }
+
+    def test_missing_fields_and_bad_status(self):
+        """Test empty required fields and unknown statuses are reported."""
+        self.operation.update(service_name="", status=["completed"])
+
+        result = self.rule.validate(self.operation)
+
+        self.assertFalse(result["is_valid"])
+        self.assertEqual(
+            result["details"]["errors"][0],
+            "Required field 'service_name' is missing or empty",
+        )
+        self.assertIn("Invalid status", result["details"]["errors"][1])
+
+    def test_valid_timestamps(self):
+        """Test ISO timestamps, with and without a Z suffix, are accepted."""
+        self.operation.update(
+            created_at="2024-01-01",
+            started_at="2024-01-01T10:00:00Z",
+            completed_at="2024-01-01T10:05:00+00:00",
+        )
+
+        self.assertTrue(self.rule.validate(self.operation)["is_valid"])
+
+    def test_invalid_timestamps(self):
+        """Test malformed and non-string timestamps are rejected."""
+        self.operation.update(
+            created_at="yesterday", started_at="2024-13-01", completed_at=12345
+        )
+
+        result = self.rule.validate(self.operation)
+
+        self.assertFalse(result["is_valid"])
+        self.assertEqual(len(result["details"]["errors"]), 3)
+
+
+class TestValidationEngine(unittest.TestCase):
+    """Test cases for ValidationEngine."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.engine = ValidationEngine()
+
+    def test_validate_group_runs_every_rule(self):
+        """Test a group returns one result per rule."""
+        results = self.engine.validate_group("path_validation", tempfile.gettempdir())
+
+        self.assertEqual(len(results), 4)
+        self.assertEqual(
+            [r["is_valid"] for r in results], [True, True, True, False]
+        )
+
+    def test_validate_group_shares_path_lookups(self):
+        """Test path rules in a group query the filesystem once per target."""
+        with patch(
+            "validation.validation_engine.PathUtils.path_exists", return_value=True
+        ) as mock_exists:
+            self.engine.validate_group("path_validation", tempfile.gettempdir())
+
+        mock_exists.assert_called_once()
+
+    def test_validate_group_shares_timestamp(self):
+        """Test all results of one group run carry the same timestamp."""
+        results = self.engine.validate_group("format_validation", "abc")
+
+        timestamps = {r["validation_timestamp"] for r in results}
+        self.assertEqual(len(timestamps), 1)
+        self.assertIsNotNone(timestamps.pop())
+
+    def test_validate_paths_bulk(self):
+        """Test bulk path validation matches per-path validation."""
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir)
+        (temp_dir / "a.bin").write_text("a")
+        (temp_dir / "sub").mkdir()
+        paths = [str(temp_dir / name) for name in ("a.bin", "sub", "missing.bin")]
+
+        with patch(
+            "validation.validation_engine.PathUtils.path_exists",
+            wraps=os.path.exists,
+        ) as mock_exists:
+            results = self.engine.validate_paths_bulk(paths, "path_exists_absolute")
+
+        # Only the name missing from the listing is looked up individually
+        mock_exists.assert_called_once_with(paths[2])
+        self.assertEqual([r["is_valid"] for r in results], [True, True, False])
+        for path, result in zip(paths, results):
+            expected = self.engine.validate_single("path_exists_absolute", path)
+            self.assertEqual(
+                result["details"]["path_info"], expected["details"]["path_info"]
+            )
+
+    def test_validate_group_fast_fail(self):
+        """Test fast_fail stops at the first failed error-severity rule."""
+        missing = str(Path(tempfile.gettempdir()) / "missing_fast_fail_dir")
+
+        full = self.engine.validate_group("path_validation", missing)
+        short = self.engine.validate_group("path_validation", missing, fast_fail=True)
+
+        self.assertEqual(len(full), 4)
+        self.assertEqual(len(short), 1)
+        self.assertEqual(short[0]["details"], full[0]["details"])
+
+    def test_validate_alphanumeric_ids_bulk(self):
+        """Test the bulk ID check agrees with the alphanumeric_id rule."""
+        ids = ["rom_01", "A-b-C", "__", "has space", "", "caf\u00e9", "x.y"]
+
+        flags = self.engine.validate_alphanumeric_ids_bulk(ids)
+
+        self.assertEqual(flags, [True, True, True, False, False, False, False])
+        self.assertEqual(
+            flags,
+            [self.engine.validate_single("alphanumeric_id", i)["is_valid"] for i in ids],
+        )
+
+    def test_default_rules_share_interned_strings(self):
+        """Test rules use slots and interned rule_id/severity strings."""
+        for rule in self.engine.rules.values():
+            self.assertFalse(hasattr(rule, "__dict__"))
+            self.assertIs(rule.severity, "error")
+
+        first = self.engine.rules["path_absolute"].rule_id
+        second = self.engine.rules["file_exists"].rule_id
+        self.assertIs(first, second)
+
+    def test_get_validation_summary(self):
+        """Test the summary tallies passes, failures and failed rule ids."""
+        results = self.engine.validate_multiple(
+            ["alphanumeric_id", "email", "missing_rule"], "abc"
+        )
+
+        summary = self.engine.get_validation_summary(results)
+
+        self.assertEqual(summary["total_validations"], 3)
+        self.assertEqual(summary["passed"], 1)
+        self.assertEqual(summary["error_count"], 2)
+        self.assertEqual(summary["warning_count"], 0)
+        self.assertEqual(summary["failed_rules"], ["email", "unknown_rule"])
+        self.assertFalse(summary["all_passed"])
+
+    def test_available_rules_follow_registration(self):
+        """Test rule listings reflect registration and direct edits to rules."""
+        before = self.engine.get_available_rules()
+        before["bogus"] = "ignored"
+        self.engine.register_rule(
+            ConfigurationValidationRule(["name"]), "named_config"
+        )
+        del self.engine.rules["email"]
+
+        after = self.engine.get_available_rules()
+        result = self.engine.validate_single("missing_rule", "target")
+
+        self.assertNotIn("bogus", after)
+        self.assertNotIn("email", after)
+        self.assertEqual(after["named_config"], "Validate configuration parameters")
+        self.assertIn("'named_config'", result["suggested_fix"])
+        self.assertNotIn("'email'", result["suggested_fix"])
+
+    def test_validate_unknown_rule(self):
+        """Test unknown rule names produce an error result."""
+        result = self.engine.validate_single("missing_rule", "target")
+
+        self.assertFalse(result["is_valid"])
+        self.assertEqual(result["rule_id"], "unknown_rule")
+
+    def test_validate_config_reuses_rule(self):
+        """Test repeated convenience calls reuse the same rule object."""
+        with patch(
+            "validation.validation_engine.ConfigurationValidationRule",
+            wraps=ConfigurationValidationRule,
+        ) as mock_rule:
+            first = self.engine.validate_config({"a": 1}, ["a", "cache_probe"])
+            second = self.engine.validate_config({"a": 1}, ["a", "cache_probe"])
+
+        self.assertEqual(mock_rule.call_count, 1)
+        self.assertFalse(first["is_valid"])
+        self.assertEqual(first["details"]["missing_fields"], ["cache_probe"])
+        self.assertEqual(second["details"], first["details"])
+
+    def test_validate_config_details_do_not_alias_rule(self):
+        """Test mutating result details leaves the cached rule unchanged."""
+        first = self.engine.validate_config({"a": 1}, ["a", "alias_probe"])
+        first["details"]["required_fields"].append("injected")
+
+        second = self.engine.validate_config({"a": 1}, ["a", "alias_probe"])
+
+        self.assertEqual(second["details"]["required_fields"], ["a", "alias_probe"])
+
+    def test_validate_config_field_types(self):
+        """Test type checks skip None values and report wrong types."""
+        result = self.engine.validate_config(
+            {"name": None, "port": "8080"},
+            ["name"],
+            field_types={"name": str, "port": int},
+        )
+
+        self.assertEqual(result["details"]["missing_fields"], ["name"])
+        self.assertEqual(
+            result["details"]["errors"],
+            [
+                "Required field 'name' is missing or None",
+                "Field 'port' must be of type int, got str",
+            ],
+        )
+
+    def test_validate_regex(self):
+        """Test the regex convenience method."""
+        self.assertTrue(self.engine.validate_regex("abc_1", r"^\w+$")["is_valid"])
+        self.assertFalse(self.engine.validate_regex("a b", r"^\w+$")["is_valid"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ directories, JSON schemas, and configuration integrity.
 """
 
 import json
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -42,6 +43,21 @@ class TestValidationResult(unittest.TestCase):
         self.assertIn("True", str_repr)
         self.assertIn("Success", str_repr)
 
+    def test_set_cross_reference_valid_deduplicates(self):
+        """Test errors and warnings are merged without duplicates."""
+        result = ValidationResult("test")
+        result.add_error("missing ref")
+
+        result.set_cross_reference_valid(
+            False,
+            errors=["missing ref", "bad ref", "bad ref"],
+            warnings=["unused", "unused"],
+        )
+
+        self.assertEqual(result.errors, ["missing ref", "bad ref"])
+        self.assertEqual(result.warnings, ["unused"])
+        self.assertFalse(result.is_valid)
+
 
 class TestValidationUtils(unittest.TestCase):
     """Test cases for ValidationUtils class."""
@@ -94,6 +110,68 @@ class TestValidationUtils(unittest.TestCase):
         self.assertFalse(result.is_valid)
         self.assertIn("Empty path", result.message)
 
+    def test_validate_file_exists_single_stat(self):
+        """Test each check stats the path once and is never answered from a cache."""
+        test_file = Path(self.temp_dir) / "stat_file.txt"
+        test_file.write_text("content")
+
+        with patch("utils.validation_utils.os.stat", wraps=os.stat) as mock_stat:
+            self.assertTrue(ValidationUtils.validate_file_exists(str(test_file)).is_valid)
+            self.assertTrue(ValidationUtils.validate_file_exists(str(test_file)).is_valid)
+
+        self.assertEqual(mock_stat.call_count, 2)
+
+    def test_validate_file_exists_sees_removed_file(self):
+        """Test a path changed between checks is re-evaluated."""
+        test_path = Path(self.temp_dir) / "changing"
+        test_path.write_text("content")
+
+        self.assertTrue(ValidationUtils.validate_file_exists(str(test_path)).is_valid)
+        test_path.unlink()
+        self.assertFalse(ValidationUtils.validate_file_exists(str(test_path)).is_valid)
+        test_path.mkdir()
+        self.assertTrue(ValidationUtils.validate_directory_exists(str(test_path)).is_valid)
+
+    def test_validate_file_exists_sees_new_file(self):
+        """Test a missing answer is not cached, so a new file is seen at once."""
+        test_file = Path(self.temp_dir) / "late_file.txt"
+
+        self.assertFalse(ValidationUtils.validate_file_exists(str(test_file)).is_valid)
+        test_file.write_text("content")
+        self.assertTrue(ValidationUtils.validate_file_exists(str(test_file)).is_valid)
+
+    def test_validate_files_exist_batch(self):
+        """Test batch file validation matches the single-path variant."""
+        base = Path(self.temp_dir)
+        (base / "a.txt").write_text("a")
+        (base / "b.txt").write_text("b")
+        (base / "sub").mkdir()
+        paths = [
+            str(base / "a.txt"),
+            str(base / "b.txt"),
+            str(base / "sub"),
+            str(base / "missing.txt"),
+            "",
+        ]
+
+        results = ValidationUtils.validate_files_exist(paths)
+
+        self.assertEqual(list(results), paths)
+        for path in paths:
+            expected = ValidationUtils.validate_file_exists(path)
+            self.assertEqual(results[path].is_valid, expected.is_valid)
+            self.assertEqual(results[path].message, expected.message)
+
+    def test_validate_files_exist_stats_repeated_path_once(self):
+        """Test a path repeated within one batch call is checked once."""
+        missing = str(Path(self.temp_dir) / "missing.txt")
+
+        with patch("utils.validation_utils.os.stat", wraps=os.stat) as mock_stat:
+            results = ValidationUtils.validate_files_exist([missing, missing])
+
+        self.assertFalse(results[missing].is_valid)
+        self.assertEqual(mock_stat.call_count, 1)
+
     def test_validate_directory_exists_valid(self):
         """Test directory existence validation for existing directory."""
         test_dir = Path(self.temp_dir) / "test_directory"
@@ -171,6 +249,17 @@ class TestValidationUtils(unittest.TestCase):
         self.assertFalse(result.is_valid)
         self.assertIn("Invalid JSON", result.message)
 
+    def test_validate_json_file_large(self):
+        """Test JSON file validation above the memory-map threshold."""
+        json_file = Path(self.temp_dir) / "large.json"
+        items = [{"id": i, "name": f"item-{i}"} for i in range(60000)]
+        json_file.write_text(json.dumps(items))
+        broken_file = Path(self.temp_dir) / "large_broken.json"
+        broken_file.write_text(json.dumps(items)[:-1])
+
+        self.assertTrue(ValidationUtils.validate_json_file(str(json_file)).is_valid)
+        self.assertFalse(ValidationUtils.validate_json_file(str(broken_file)).is_valid)
+
     def test_validate_json_file_missing(self):
         """Test JSON file validation for missing file."""
         missing_file = Path(self.temp_dir) / "missing.json"
@@ -248,6 +337,24 @@ class TestValidationUtils(unittest.TestCase):
         self.assertFalse(result.is_valid)
         self.assertIn("Forbidden pattern", result.message)
 
+    def test_validate_forbidden_patterns_reports_first_pattern_in_order(self):
+        """Test the reported pattern follows list order, not match position."""
+        result = ValidationUtils.validate_forbidden_patterns(
+            "a<b/../c", [r"\.\.", r"<"]
+        )
+
+        self.assertFalse(result.is_valid)
+        self.assertIn(r"\.\.", result.message)
+
+    def test_validate_forbidden_patterns_with_backreference(self):
+        """Test patterns that cannot be merged are still checked."""
+        result = ValidationUtils.validate_forbidden_patterns(
+            "path//file", [r"(/)\1", r"[<>]"]
+        )
+
+        self.assertFalse(result.is_valid)
+        self.assertIn(r"(/)\1", result.message)
+
     def test_validate_forbidden_patterns_empty_patterns(self):
         """Test forbidden pattern validation with empty pattern list."""
         any_path = "any/path/here"
@@ -358,6 +465,21 @@ class TestValidationUtils(unittest.TestCase):
         self.assertIn("1 validation(s) failed", combined.message)
         self.assertEqual(len(combined.details["failed_validations"]), 1)
 
+    def test_combine_validation_results_without_details(self):
+        """Test combining results without building per-result dicts."""
+        results = [
+            ValidationResult(True, "Test 1 passed"),
+            ValidationResult(False, "Test 2 failed"),
+        ]
+
+        combined = ValidationUtils.combine_validation_results(
+            results, include_details=False
+        )
+
+        self.assertFalse(combined.is_valid)
+        self.assertNotIn("individual_results", combined.details)
+        self.assertEqual(combined.details["failed_validations"], ["Test 2 failed"])
+
     def test_combine_validation_results_empty(self):
         """Test combining empty validation results list."""
         combined = ValidationUtils.combine_validation_results([])
@@ -399,6 +521,18 @@ class TestValidationUtils(unittest.TestCase):
         self.assertIn("failed_validation_names", summary.details)
         self.assertEqual(len(summary.details["failed_validation_names"]), 2)
 
+    def test_create_validation_summary_foreign_results(self):
+        """Test summaries accept any objects exposing is_valid."""
+        results = {
+            "native": ValidationResult(False, "Invalid JSON"),
+            "foreign": MagicMock(spec=["is_valid"], is_valid=True),
+        }
+
+        summary = ValidationUtils.create_validation_summary(results)
+
+        self.assertEqual(summary.details["passed_validations"], 1)
+        self.assertEqual(summary.details["failed_validation_names"], ["native"])
+
     def test_create_validation_summary_empty(self):
         """Test creating validation summary with empty results."""
         summary = ValidationUtils.create_validation_summary({})
@@ -407,6 +541,24 @@ class TestValidationUtils(unittest.TestCase):
         self.assertIn("No validations performed", summary.message)
         self.assertEqual(summary.details["total_validations"], 0)
 
+    def test_pydantic_validation_with_model(self):
+        """Test schema validation against a real Pydantic model."""
+        from pydantic import BaseModel
+
+        class Person(BaseModel):
+            name: str
+            age: int
+
+        valid = ValidationUtils._validate_with_pydantic(
+            {"name": "test", "age": 25}, Person
+        )
+        invalid = ValidationUtils._validate_with_pydantic({"name": "test"}, Person)
+
+        self.assertTrue(valid.is_valid)
+        self.assertFalse(invalid.is_valid)
+        self.assertFalse(invalid.schema_valid)
+        self.assertIn("Schema validation failed", invalid.message)
+
     def test_pydantic_validation_mock(self):
         """Test the private Pydantic validation method with mock."""
         # This tests the structure of the method without actual Pydantic dependency